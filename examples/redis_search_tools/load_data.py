@@ -20,12 +20,20 @@ Data is designed to demonstrate when different search tools excel:
 - Range search: finding all highly relevant docs above threshold
 """
 
+import hashlib
+import json
 import os
 from pathlib import Path
 
 from redisvl.index import SearchIndex
 from redisvl.utils.vectorize import HFTextVectorizer
 
+EMBEDDING_MODEL = "redis/langcache-embed-v2"
+
+# On-disk embedding cache so re-running the loader skips the model entirely
+# when the sample content has not changed.
+EMBEDDING_CACHE_PATH = Path(__file__).parent / ".embeddings_cache.json"
+
 # Documents designed to showcase different search tool strengths
 SAMPLE_DOCS = [
     # === SEMANTIC SEARCH DEMOS ===
@@ -212,24 +220,77 @@ SAMPLE_DOCS = [
 ]
 
 
+def _embedding_cache_key(content: str) -> str:
+  """Key an embedding by model name and content hash.
+
+  Including the model name means switching vectorizers invalidates old
+  entries instead of silently reusing embeddings of the wrong shape.
+  """
+  digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+  return f"{EMBEDDING_MODEL}:{digest}"
+
+
+def _load_embedding_cache() -> dict[str, bytes]:
+  """Load cached embeddings from disk, or return an empty cache.
+
+  Embeddings are stored as hex strings in JSON; an unreadable or malformed
+  file is ignored and the embeddings recomputed.
+  """
+  if not EMBEDDING_CACHE_PATH.exists():
+    return {}
+  try:
+    with EMBEDDING_CACHE_PATH.open("r", encoding="utf-8") as f:
+      return {k: bytes.fromhex(v) for k, v in json.load(f).items()}
+  except (OSError, ValueError, TypeError, AttributeError):
+    return {}
+
+
+def _save_embedding_cache(cache: dict[str, bytes]) -> None:
+  """Persist embeddings to disk; failures only cost a recompute next run."""
+  try:
+    with EMBEDDING_CACHE_PATH.open("w", encoding="utf-8") as f:
+      json.dump({k: v.hex() for k, v in cache.items()}, f)
+  except OSError as e:
+    print(f"  Warning: could not write embedding cache: {e}")
+
+
 def load_data() -> None:
   """Load sample documents into Redis with embeddings."""
   schema_path = Path(__file__).parent / "schema.yaml"
   redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
 
   print(f"Connecting to Redis at {redis_url}")
-  index = SearchIndex.from_yaml(str(schema_path))
-  index.connect(redis_url)
+  index = SearchIndex.from_yaml(str(schema_path), redis_url=redis_url)
 
   print("Creating index (will overwrite if exists)...")
   index.create(overwrite=True)
 
   print("Generating embeddings...")
-  vectorizer = HFTextVectorizer(model="redis/langcache-embed-v2")
+  cache = _load_embedding_cache()
+  keys = [_embedding_cache_key(doc["content"]) for doc in SAMPLE_DOCS]
+  misses = [
+      (key, doc["content"])
+      for key, doc in zip(keys, SAMPLE_DOCS)
+      if key not in cache
+  ]
+
+  if misses:
+    # Embed all uncached documents in a single batch rather than one call
+    # per doc.
+    vectorizer = HFTextVectorizer(model=EMBEDDING_MODEL)
+    contents = [content for _, content in misses]
+    new_embeddings = vectorizer.embed_many(
+        contents, as_buffer=True, batch_size=len(contents)
+    )
+    for (key, _), embedding in zip(misses, new_embeddings):
+      cache[key] = embedding
+    _save_embedding_cache(cache)
+  print(f"  {len(keys) - len(misses)} cached, {len(misses)} computed")
+
+  embeddings = [cache[key] for key in keys]
 
   docs_with_embeddings = []
-  for doc in SAMPLE_DOCS:
-    embedding = vectorizer.embed(doc["content"], as_buffer=True)
+  for doc, embedding in zip(SAMPLE_DOCS, embeddings):
     docs_with_embeddings.append({**doc, "embedding": embedding})
     print(f"  [{doc['doc_type']:9}] {doc['title']}")
 
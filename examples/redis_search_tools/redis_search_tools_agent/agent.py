@@ -14,14 +14,18 @@
 
 """Redis search agent demonstrating vector, text, range, and hybrid search tools."""
 
+import functools
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 from google.adk import Agent
+from redis import Redis
 from redisvl.index import SearchIndex
 from redisvl.utils.vectorize import HFTextVectorizer
 
+from adk_redis.tools import RedisHybridSearchTool
+from adk_redis.tools import RedisMultiSearchTool
 from adk_redis.tools import RedisRangeQueryConfig
 from adk_redis.tools import RedisRangeSearchTool
 from adk_redis.tools import RedisTextQueryConfig
@@ -30,6 +34,9 @@ from adk_redis.tools import RedisVectorQueryConfig
 from adk_redis.tools import RedisVectorSearchTool
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schema.yaml"
+EMBEDDING_MODEL = "redis/langcache-embed-v2"
+# Upper bound on pooled Redis connections shared by all search tools
+REDIS_MAX_CONNECTIONS = 32
 RETURN_FIELDS = [
     "title",
     "content",
@@ -41,7 +48,18 @@ RETURN_FIELDS = [
 
 INSTRUCTION = """You are a helpful assistant with a technical knowledge base.
 
-You have 3 search tools, each optimized for different query types:
+Your default search tool is hybrid_search. The other tools are specialized
+fallbacks for the cases described below.
+
+## hybrid_search (Vector + BM25, fused in Redis) - DEFAULT
+Best for: Almost every question, including ambiguous ones that mix concepts
+with exact terms.
+How it works: Runs vector KNN and BM25 keyword matching in a single Redis
+query and returns one merged ranking.
+Returns: Top-K documents by combined semantic and keyword relevance.
+Example queries:
+  - "How does HNSW make vector search fast?" -> concept + acronym
+  - "Caching LLM responses in Redis" -> concept + product name
 
 ## semantic_search (Vector KNN)
 Best for: Conceptual questions, natural language queries, finding similar content.
@@ -70,34 +88,80 @@ Use when:
   - Comprehensive research: "All vector search algorithms"
   - Quality filtering: Only docs highly relevant to the query
 
+## multi_search (All three in one call)
+Best for: Ambiguous queries where you would otherwise call several tools.
+How it works: Runs semantic, keyword, and range search together in a single
+Redis round trip.
+Returns: Separate "semantic", "keyword", and "range" result sets.
+
 ## Strategy
-1. Start with the most appropriate tool based on query type
-2. If results are poor or incomplete, try another tool
-3. For broad topics, consider range_search first, then refine with others
-4. For technical terms/acronyms, prefer keyword_search
-5. For natural questions, prefer semantic_search
+1. Call hybrid_search once and answer from its results
+2. Do not retry the same question with other tools; hybrid_search already
+   covers both semantic and keyword matching
+3. Use range_search only when the user asks for everything on a topic
+4. Use keyword_search only for an exact identifier (API name, error message)
+   that hybrid_search did not surface
+5. Use multi_search only when you need the semantic, keyword, and range
+   result sets side by side
 
 Always cite sources with title and difficulty level."""
 
 
 def get_index(schema_path: Path, redis_url: str) -> SearchIndex:
-  """Create and connect to Redis search index."""
-  index = SearchIndex.from_yaml(str(schema_path))
-  index.connect(redis_url)
-  return index
+  """Create and connect to Redis search index.
+
+  All search tools share the returned index and therefore one connection
+  pool. Sync indexes run queries in worker threads, so concurrent tool calls
+  each check out their own pooled connection. TCP keepalive and periodic
+  health checks stop idle connections from going stale between turns.
+  """
+  client = Redis.from_url(
+      redis_url,
+      max_connections=REDIS_MAX_CONNECTIONS,
+      socket_keepalive=True,
+      health_check_interval=30,
+  )
+  return SearchIndex.from_yaml(str(schema_path), redis_client=client)
+
+
+@functools.lru_cache(maxsize=4)
+def get_vectorizer(
+    model: str, backend: str = "torch", onnx_file: str | None = None
+) -> HFTextVectorizer:
+  """Load a vectorizer once per model/backend (e.g. "onnx" + int8 file)."""
+  kwargs: dict = {}
+  if backend != "torch":
+    kwargs["backend"] = backend
+  if onnx_file:
+    kwargs["model_kwargs"] = {"file_name": onnx_file}
+  return HFTextVectorizer(model=model, **kwargs)
 
 
 def get_search_tools(index: SearchIndex, vectorizer: HFTextVectorizer) -> list:
   """Create search tools for the agent."""
-  vector_config = RedisVectorQueryConfig(num_results=5)
+  # Widen the HNSW candidate list beyond the default (10) for better recall;
+  # for range queries the equivalent knob is epsilon (default 0.01).
+  vector_config = RedisVectorQueryConfig(num_results=5, ef_runtime=40)
   text_config = RedisTextQueryConfig(
       text_field_name="content",
       num_results=5,
       text_scorer="BM25STD",
   )
-  range_config = RedisRangeQueryConfig(distance_threshold=0.5)
+  range_config = RedisRangeQueryConfig(distance_threshold=0.5, epsilon=0.05)
 
   return [
+      # Config is auto-selected: native FT.HYBRID on Redis 8.4+ with
+      # RedisVL 0.13+, otherwise an FT.AGGREGATE query fusing both scores.
+      RedisHybridSearchTool(
+          name="hybrid_search",
+          description=(
+              "Default search: combines semantic similarity and keyword "
+              "matching in a single Redis query."
+          ),
+          index=index,
+          vectorizer=vectorizer,
+          return_fields=RETURN_FIELDS,
+      ),
       RedisVectorSearchTool(
           name="semantic_search",
           description="Semantic similarity search for conceptual queries.",
@@ -125,6 +189,19 @@ def get_search_tools(index: SearchIndex, vectorizer: HFTextVectorizer) -> list:
           config=range_config,
           return_fields=RETURN_FIELDS,
       ),
+      RedisMultiSearchTool(
+          name="multi_search",
+          description=(
+              "Run semantic, keyword, and range search together in one "
+              "Redis round trip. Use when the best search type is unclear."
+          ),
+          index=index,
+          vectorizer=vectorizer,
+          vector_config=vector_config,
+          text_config=text_config,
+          range_config=range_config,
+          return_fields=RETURN_FIELDS,
+      ),
   ]
 
 
@@ -134,13 +211,17 @@ def create_agent() -> Agent:
 
   redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
   index = get_index(SCHEMA_PATH, redis_url)
-  vectorizer = HFTextVectorizer(model="redis/langcache-embed-v2")
+  vectorizer = get_vectorizer(
+      EMBEDDING_MODEL,
+      backend=os.getenv("EMBEDDING_BACKEND", "torch"),
+      onnx_file=os.getenv("EMBEDDING_ONNX_FILE"),
+  )
   tools = get_search_tools(index, vectorizer)
 
   return Agent(
       model="gemini-2.5-flash",
       name="redis_search_tools_agent",
-      instruction=INSTRUCTION,
+      static_instruction=INSTRUCTION,
       tools=tools,
   )
 
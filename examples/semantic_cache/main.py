@@ -15,6 +15,7 @@
 """Example of using semantic caching with ADK agents."""
 
 import asyncio
+import functools
 import os
 
 from dotenv import load_dotenv
@@ -33,16 +34,31 @@ from adk_redis.cache import RedisVLCacheProviderConfig
 load_dotenv()
 
 
-def create_cached_agent() -> tuple[Agent, LLMResponseCache]:
-  """Create an agent with semantic caching enabled."""
+@functools.lru_cache(maxsize=4)
+def get_vectorizer(
+    model: str, backend: str = "torch", onnx_file: str | None = None
+):
+  """Load a vectorizer once per model/backend (e.g. "onnx" + int8 file)."""
   # Import vectorizer - using Redis's LangCache embedding model
   # Note: RedisVL supports many vectorizers (OpenAI, Cohere, HuggingFace, etc.)
   # See: https://docs.redisvl.com/en/latest/user_guide/vectorizers.html
   from redisvl.utils.vectorize import HFTextVectorizer
 
+  kwargs: dict = {}
+  if backend != "torch":
+    kwargs["backend"] = backend
+  if onnx_file:
+    kwargs["model_kwargs"] = {"file_name": onnx_file}
+  return HFTextVectorizer(model=model, **kwargs)
+
+
+def create_cached_agent() -> tuple[Agent, LLMResponseCache]:
+  """Create an agent with semantic caching enabled."""
   # Create vectorizer for semantic similarity using Redis's optimized model
-  vectorizer = HFTextVectorizer(
-      model="redis/langcache-embed-v1"  # Runs locally, no API key needed
+  vectorizer = get_vectorizer(
+      "redis/langcache-embed-v1",  # Runs locally, no API key needed
+      backend=os.getenv("EMBEDDING_BACKEND", "torch"),
+      onnx_file=os.getenv("EMBEDDING_ONNX_FILE"),
   )
 
   # Create cache provider
@@ -52,6 +68,7 @@ def create_cached_agent() -> tuple[Agent, LLMResponseCache]:
           name="adk_demo_cache",
           ttl=3600,  # 1 hour TTL
           distance_threshold=0.1,  # Semantic similarity threshold
+          local_cache_size=256,  # Serve repeat prompts from process memory
       ),
       vectorizer=vectorizer,
   )
@@ -95,36 +112,55 @@ async def main():
       session_service=session_service,
   )
 
-  # Create a session
-  session = await session_service.create_session(
-      app_name="semantic_cache_demo",
-      user_id="demo_user",
-  )
-
-  # Test queries - the second similar query should hit the cache
-  queries = [
-      "What is Python programming language?",
-      "Tell me about Python programming",  # Semantically similar - should hit cache
-      "How do I write a for loop in Python?",  # Different question
+  # Test queries. Queries within a phase are independent and run
+  # concurrently; the second phase repeats a phase-one question in different
+  # words, so it runs after phase one has populated the cache.
+  phases = [
+      [
+          "What is Python programming language?",
+          "How do I write a for loop in Python?",  # Different question
+      ],
+      [
+          "Tell me about Python programming",  # Semantically similar - should hit cache
+      ],
   ]
+  queries = [query for phase in phases for query in phase]
 
-  for i, query in enumerate(queries, 1):
-    print(f"\n{'='*60}")
-    print(f"Query {i}: {query}")
-    print("=" * 60)
+  # Embed all queries in one batch up front instead of once per request
+  await llm_cache.prewarm(
+      queries, app_name="semantic_cache_demo", user_id="demo_user"
+  )
 
+  async def run_query(i: int, query: str) -> None:
+    # Each query gets its own session: concurrent turns must not share a
+    # session, and first_message_only caching applies per session.
+    session = await session_service.create_session(
+        app_name="semantic_cache_demo",
+        user_id="demo_user",
+    )
     content = types.Content(role="user", parts=[types.Part(text=query)])
 
+    response = None
     async for event in runner.run_async(
         user_id="demo_user",
         session_id=session.id,
         new_message=content,
     ):
-      if event.content and event.content.parts:
-        for part in event.content.parts:
-          if part.text:
-            print(f"Response: {part.text[:200]}...")
-            break
+      if response is None and event.content and event.content.parts:
+        response = next((p.text for p in event.content.parts if p.text), None)
+
+    # Print the whole block at once so concurrent queries don't interleave
+    print(
+        f"\n{'='*60}\nQuery {i}: {query}\n{'=' * 60}\n"
+        f"Response: {(response or '')[:200]}..."
+    )
+
+  first = 1
+  for phase in phases:
+    await asyncio.gather(
+        *(run_query(first + j, query) for j, query in enumerate(phase))
+    )
+    first += len(phase)
 
   print("\n" + "=" * 60)
   print("Demo complete! Check Redis for cached entries.")
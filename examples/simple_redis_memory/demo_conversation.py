@@ -5,10 +5,24 @@ Shows real-time memory extraction and recall across sessions.
 """
 
 import asyncio
+import json
+import sys
 import uuid
 
 import httpx
 
+try:
+  import orjson
+
+  json_loads = orjson.loads
+  json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib
+  json_loads = json.loads
+
+  def json_dumps(obj):
+    return json.dumps(obj).encode("utf-8")
+
+
 # Configuration
 ADK_URL = "http://localhost:8080"
 MEMORY_SERVER_URL = "http://localhost:8000"
@@ -16,6 +30,33 @@ APP_NAME = "redis_memory_agent"
 USER_ID = f"demo_user_{uuid.uuid4().hex[:8]}"
 NAMESPACE = "adk_agent_memory"
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One pooled client serves every request in the demo; keep connections to
+# the ADK server and memory server alive between turns.
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60.0)
+HTTP_TIMEOUT = httpx.Timeout(30.0)
+
+# Session 1 script: (message, seconds to wait for extraction afterwards)
+CONVERSATIONS = (
+    ("Hi! My name is Alex and I work as a data scientist at TechCorp.", 3),
+    ("I've been working with machine learning for about 5 years now.", 3),
+    ("My favorite frameworks are PyTorch and scikit-learn.", 3),
+    ("I have two cats named Pixel and Binary.", 3),
+    ("I'm currently working on a recommendation system project.", 3),
+)
+
+# Session 2 script: questions that should be answered from long-term memory
+RECALL_QUESTIONS = (
+    "What do you remember about me?",
+    "What's my job?",
+    "What are my cats' names?",
+    "What project am I working on?",
+)
+
+# Max recall questions in flight at once against the ADK server
+RECALL_CONCURRENCY = 3
+
 
 # ANSI colors for visualization
 class Colors:
@@ -29,14 +70,19 @@ class Colors:
   END = "\033[0m"
 
 
+_RULE = "=" * 70
+_HEADER_FMT = (
+    f"\n{Colors.HEADER}{Colors.BOLD}{_RULE}\n{{}}\n{_RULE}{Colors.END}\n\n"
+)
+_SECTION_FMT = f"\n{Colors.CYAN}{Colors.BOLD}--- {{}} ---{Colors.END}\n"
+
+
 def print_header(text):
-  print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 70}")
-  print(f"{text}")
-  print(f"{'=' * 70}{Colors.END}\n")
+  sys.stdout.write(_HEADER_FMT.format(text))
 
 
 def print_section(text):
-  print(f"\n{Colors.CYAN}{Colors.BOLD}--- {text} ---{Colors.END}")
+  sys.stdout.write(_SECTION_FMT.format(text))
 
 
 def print_user(text):
@@ -59,11 +105,43 @@ async def create_session(client):
   """Create a new session."""
   response = await client.post(
       f"{ADK_URL}/apps/{APP_NAME}/users/{USER_ID}/sessions",
-      json={},
+      content=json_dumps({}),
+      headers=JSON_HEADERS,
       timeout=30.0,
   )
   response.raise_for_status()
-  return response.json().get("id")
+  return json_loads(response.content).get("id")
+
+
+async def iter_sse_data(response):
+  """Yield decoded JSON payloads from an SSE response's data lines.
+
+  Works on raw bytes with a single reusable buffer rather than decoding
+  every chunk to str and allocating a new string per line; the JSON
+  decoder accepts the bytes payload directly.
+  """
+  buf = bytearray()
+
+  def parse(line):
+    line = line.rstrip(b"\r")
+    if not line.startswith(b"data: "):
+      return None
+    try:
+      return json_loads(line[6:])
+    except json.JSONDecodeError:
+      return None
+
+  async for chunk in response.aiter_bytes():
+    buf += chunk
+    while (i := buf.find(b"\n")) != -1:
+      data = parse(bytes(buf[:i]))
+      del buf[: i + 1]
+      if data is not None:
+        yield data
+  if buf:
+    data = parse(bytes(buf))
+    if data is not None:
+      yield data
 
 
 async def send_message(client, session_id, message):
@@ -71,30 +149,31 @@ async def send_message(client, session_id, message):
   async with client.stream(
       "POST",
       f"{ADK_URL}/run_sse",
-      json={
-          "app_name": APP_NAME,
-          "user_id": USER_ID,
-          "session_id": session_id,
-          "new_message": {"role": "user", "parts": [{"text": message}]},
-      },
+      content=json_dumps(
+          {
+              "app_name": APP_NAME,
+              "user_id": USER_ID,
+              "session_id": session_id,
+              "new_message": {"role": "user", "parts": [{"text": message}]},
+          }
+      ),
+      headers=JSON_HEADERS,
       timeout=60.0,
   ) as response:
     response.raise_for_status()
-    agent_response = ""
-    async for line in response.aiter_lines():
-      if line.startswith("data: "):
-        try:
-          import json
-
-          data = json.loads(line[6:])
-          content = data.get("content", {})
-          parts = content.get("parts", [])
-          for part in parts:
-            if "text" in part:
-              agent_response = part["text"]
-        except Exception:
-          pass
-    return agent_response if agent_response else "(no response)"
+    chunks = []
+    async for data in iter_sse_data(response):
+      parts = (data.get("content") or {}).get("parts") or []
+      texts = [part["text"] for part in parts if "text" in part]
+      if not texts:
+        continue
+      if data.get("partial"):
+        # Streaming deltas: accumulate, join once at the end.
+        chunks.extend(texts)
+      else:
+        # A complete event carries the full text and supersedes any deltas.
+        chunks = texts
+    return "".join(chunks) if chunks else "(no response)"
 
 
 async def get_working_memory(client, session_id):
@@ -106,7 +185,7 @@ async def get_working_memory(client, session_id):
         timeout=10.0,
     )
     if response.status_code == 200:
-      return response.json()
+      return json_loads(response.content)
   except Exception:
     pass
   return None
@@ -117,16 +196,19 @@ async def get_long_term_memories(client):
   try:
     response = await client.post(
         f"{MEMORY_SERVER_URL}/v1/long-term-memory/search",
-        json={
-            "text": "user",
-            "namespace": {"eq": NAMESPACE},
-            "user_id": {"eq": USER_ID},
-            "limit": 20,
-        },
+        content=json_dumps(
+            {
+                "text": "user",
+                "namespace": {"eq": NAMESPACE},
+                "user_id": {"eq": USER_ID},
+                "limit": 20,
+            }
+        ),
+        headers=JSON_HEADERS,
         timeout=10.0,
     )
     if response.status_code == 200:
-      return response.json().get("memories", [])
+      return json_loads(response.content).get("memories", [])
   except Exception:
     pass
   return []
@@ -136,8 +218,13 @@ async def show_memory_state(client, session_id):
   """Display current memory state."""
   print_section("Current Memory State")
 
+  # Both tiers are independent requests, so fetch them concurrently.
+  wm, ltm = await asyncio.gather(
+      get_working_memory(client, session_id),
+      get_long_term_memories(client),
+  )
+
   # Working memory
-  wm = await get_working_memory(client, session_id)
   if wm:
     messages = wm.get("messages", [])
     memories = wm.get("memories", [])
@@ -147,7 +234,6 @@ async def show_memory_state(client, session_id):
     )
 
   # Long-term memory
-  ltm = await get_long_term_memories(client)
   print(f"  Long-Term Memory: {len(ltm)} facts stored")
   if ltm:
     for i, mem in enumerate(ltm[:5], 1):
@@ -155,6 +241,30 @@ async def show_memory_state(client, session_id):
       print(f"    {i}. {text}...")
 
 
+async def wait_for_extraction(
+    client, expected, max_wait=10.0, interval=0.5, max_interval=2.0
+):
+  """Poll long-term memory until extraction finishes or max_wait elapses.
+
+  Returns as soon as the expected number of facts is stored, or once a
+  non-zero count holds steady across two consecutive polls. The poll
+  interval doubles up to max_interval.
+  """
+  loop = asyncio.get_running_loop()
+  start = loop.time()
+  previous = None
+  while True:
+    count = len(await get_long_term_memories(client))
+    elapsed = loop.time() - start
+    settled = count >= expected or (count and count == previous)
+    if settled or elapsed >= max_wait:
+      return count, elapsed
+    previous = count
+    print(f"\r  {count} facts so far, waiting...", end="", flush=True)
+    await asyncio.sleep(min(interval, max_wait - elapsed))
+    interval = min(interval * 2, max_interval)
+
+
 async def run_demo():
   print_header("REDIS MEMORY DEMO (adk-redis)")
   print(
@@ -168,21 +278,15 @@ Namespace: {NAMESPACE}
 """
   )
 
-  async with httpx.AsyncClient() as client:
+  async with httpx.AsyncClient(
+      limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+  ) as client:
     # Session 1: Share personal information
     session1 = await create_session(client)
     print_header("SESSION 1: Sharing Information")
     print_info(f"Session ID: {session1[:8]}...")
 
-    conversations = [
-        ("Hi! My name is Alex and I work as a data scientist at TechCorp.", 3),
-        ("I've been working with machine learning for about 5 years now.", 3),
-        ("My favorite frameworks are PyTorch and scikit-learn.", 3),
-        ("I have two cats named Pixel and Binary.", 3),
-        ("I'm currently working on a recommendation system project.", 3),
-    ]
-
-    for message, delay in conversations:
+    for message, delay in CONVERSATIONS:
       print_user(message)
       response = await send_message(client, session1, message)
       print_agent(response[:150] + "..." if len(response) > 150 else response)
@@ -192,37 +296,39 @@ Namespace: {NAMESPACE}
 
     # Wait for final extraction
     print_section("Waiting for Memory Extraction")
-    print_info("Waiting 10 seconds for background extraction to complete...")
-    for i in range(10, 0, -1):
-      print(f"\r  {i} seconds remaining...", end="", flush=True)
-      await asyncio.sleep(1)
-    print("\r  Done!                    ")
+    print_info("Polling for background extraction to complete (max 10s)...")
+    count, elapsed = await wait_for_extraction(
+        client, expected=len(CONVERSATIONS)
+    )
+    print(f"\r  Done! {count} facts after {elapsed:.1f}s          ")
 
     await show_memory_state(client, session1)
 
-    # Session 2: Test memory recall in a NEW session
-    session2 = await create_session(client)
-    print_header("SESSION 2: Testing Memory Recall (NEW SESSION)")
-    print_info(f"Session ID: {session2[:8]}...")
-    print_info("This is a BRAND NEW session - testing if memories persist!")
+    # Session 2: Test memory recall in NEW sessions. Each question gets its
+    # own fresh session so the questions are independent and can be sent
+    # concurrently without racing on a shared session's event history.
+    print_header("SESSION 2: Testing Memory Recall (NEW SESSIONS)")
+    print_info("Each question uses a BRAND NEW session - testing if memories")
+    print_info("persist!")
+
+    semaphore = asyncio.Semaphore(RECALL_CONCURRENCY)
+
+    async def ask(question):
+      async with semaphore:
+        session_id = await create_session(client)
+        return session_id, await send_message(client, session_id, question)
 
-    recall_questions = [
-        "What do you remember about me?",
-        "What's my job?",
-        "What are my cats' names?",
-        "What project am I working on?",
-    ]
+    results = await asyncio.gather(*(ask(q) for q in RECALL_QUESTIONS))
 
-    for question in recall_questions:
+    for question, (session_id, response) in zip(RECALL_QUESTIONS, results):
+      print_info(f"Session ID: {session_id[:8]}...")
       print_user(question)
-      response = await send_message(client, session2, question)
       print_agent(response[:200] + "..." if len(response) > 200 else response)
       print()
-      await asyncio.sleep(1)
 
     # Final summary
     print_header("DEMO COMPLETE")
-    await show_memory_state(client, session2)
+    await show_memory_state(client, results[0][0])
     print(
         """
 Summary:
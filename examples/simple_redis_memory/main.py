@@ -24,7 +24,6 @@ This provides the complete two-tier memory architecture:
 """
 
 import os
-from urllib.parse import urlparse
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
@@ -42,8 +41,11 @@ load_dotenv()
 
 def parse_base_url(uri: str) -> str:
   """Parse URI to extract base URL."""
-  parsed = urlparse(uri)
-  location = parsed.netloc + parsed.path
+  # Strip the registry scheme (e.g. "redis-working-memory://") with a plain
+  # string split; a full urlparse is unnecessary for host[:port][/path].
+  _, sep, location = uri.partition("://")
+  if not sep:
+    location = uri
   return (
       location
       if location.startswith(("http://", "https://"))
@@ -51,34 +53,38 @@ def parse_base_url(uri: str) -> str:
   )
 
 
+# Service settings read from the environment once at import; the factories
+# only fill in the server URL from the registry URI.
+_NAMESPACE = os.getenv("REDIS_MEMORY_NAMESPACE", "adk_agent_memory")
+_EXTRACTION_STRATEGY = os.getenv("REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete")
+_SESSION_CONFIG = RedisWorkingMemorySessionServiceConfig(
+    default_namespace=_NAMESPACE,
+    model_name=os.getenv("REDIS_MEMORY_MODEL_NAME", "gpt-4o"),
+    context_window_max=int(os.getenv("REDIS_MEMORY_CONTEXT_WINDOW", "8000")),
+    extraction_strategy=_EXTRACTION_STRATEGY,
+)
+_MEMORY_CONFIG = RedisLongTermMemoryServiceConfig(
+    default_namespace=_NAMESPACE,
+    extraction_strategy=_EXTRACTION_STRATEGY,
+    recency_boost=os.getenv("REDIS_MEMORY_RECENCY_BOOST", "true").lower()
+    == "true",
+    semantic_weight=float(os.getenv("REDIS_MEMORY_SEMANTIC_WEIGHT", "0.7")),
+    recency_weight=float(os.getenv("REDIS_MEMORY_RECENCY_WEIGHT", "0.3")),
+)
+
+
 def redis_session_factory(uri: str, **kwargs):
   """Factory function for creating RedisWorkingMemorySessionService from URI."""
-  base_url = parse_base_url(uri)
-  config = RedisWorkingMemorySessionServiceConfig(
-      api_base_url=base_url,
-      default_namespace=os.getenv("REDIS_MEMORY_NAMESPACE", "adk_agent_memory"),
-      model_name=os.getenv("REDIS_MEMORY_MODEL_NAME", "gpt-4o"),
-      context_window_max=int(os.getenv("REDIS_MEMORY_CONTEXT_WINDOW", "8000")),
-      extraction_strategy=os.getenv(
-          "REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete"
-      ),
+  config = _SESSION_CONFIG.model_copy(
+      update={"api_base_url": parse_base_url(uri)}
   )
   return RedisWorkingMemorySessionService(config=config)
 
 
 def redis_memory_factory(uri: str, **kwargs):
   """Factory function for creating RedisLongTermMemoryService from URI."""
-  base_url = parse_base_url(uri)
-  config = RedisLongTermMemoryServiceConfig(
-      api_base_url=base_url,
-      default_namespace=os.getenv("REDIS_MEMORY_NAMESPACE", "adk_agent_memory"),
-      extraction_strategy=os.getenv(
-          "REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete"
-      ),
-      recency_boost=os.getenv("REDIS_MEMORY_RECENCY_BOOST", "true").lower()
-      == "true",
-      semantic_weight=float(os.getenv("REDIS_MEMORY_SEMANTIC_WEIGHT", "0.7")),
-      recency_weight=float(os.getenv("REDIS_MEMORY_RECENCY_WEIGHT", "0.3")),
+  config = _MEMORY_CONFIG.model_copy(
+      update={"api_base_url": parse_base_url(uri)}
   )
   return RedisLongTermMemoryService(config=config)
 
@@ -108,10 +114,10 @@ app: FastAPI = get_fast_api_app(
 
 if __name__ == "__main__":
   port = int(os.environ.get("PORT", 8080))
-  namespace = os.getenv("REDIS_MEMORY_NAMESPACE", "adk_agent_memory")
+  namespace = _NAMESPACE
   server = os.getenv("REDIS_MEMORY_SERVER_URL", "http://localhost:8000")
-  extraction = os.getenv("REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete")
-  context_window = os.getenv("REDIS_MEMORY_CONTEXT_WINDOW", "8000")
+  extraction = _EXTRACTION_STRATEGY
+  context_window = _SESSION_CONFIG.context_window_max
 
   print(
       f"""
@@ -132,4 +138,11 @@ Two-Tier Architecture:
   Tier 2 (Long-Term Memory): Extracted facts, preferences, semantic search
 """
   )
-  uvicorn.run(app, host="0.0.0.0", port=port)
+  # Multiple workers need an import string so each process builds the app
+  workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+  uvicorn.run(
+      "main:app" if workers > 1 else app,
+      host="0.0.0.0",
+      port=port,
+      workers=workers,
+  )
@@ -26,28 +26,7 @@ from google.adk.agents.callback_context import CallbackContext
 from google.adk.tools import load_memory
 from google.adk.tools import preload_memory
 
-
-def before_agent(callback_context: CallbackContext):
-  """Update state before agent runs."""
-  callback_context.state["_time"] = datetime.now().isoformat()
-
-
-async def after_agent(callback_context: CallbackContext):
-  """Store session to long-term memory after agent completes."""
-  # This triggers memory extraction to long-term memory
-  await callback_context.add_session_to_memory()
-
-
-root_agent = Agent(
-    model="gemini-2.5-flash",
-    name="redis_memory_agent",
-    description=(
-        "Agent with full two-tier Redis memory: working memory for sessions,"
-        " long-term memory for persistence."
-    ),
-    before_agent_callback=before_agent,
-    after_agent_callback=after_agent,
-    instruction="""You are a helpful assistant with a powerful two-tier memory system.
+STATIC_INSTRUCTION = """You are a helpful assistant with a powerful two-tier memory system.
 
 ## Your Memory Capabilities
 
@@ -68,8 +47,33 @@ root_agent = Agent(
 
 - Be conversational and remember details the user shares
 - Reference past interactions when relevant
-- Ask clarifying questions to learn more about the user
+- Ask clarifying questions to learn more about the user"""
 
-Current time: {_time}""",
+
+def before_agent(callback_context: CallbackContext):
+  """Update state before agent runs."""
+  callback_context.state["_time"] = datetime.now().isoformat()
+
+
+async def after_agent(callback_context: CallbackContext):
+  """Store session to long-term memory after agent completes."""
+  # This triggers memory extraction to long-term memory
+  await callback_context.add_session_to_memory()
+
+
+root_agent = Agent(
+    model="gemini-2.5-flash",
+    name="redis_memory_agent",
+    description=(
+        "Agent with full two-tier Redis memory: working memory for sessions,"
+        " long-term memory for persistence."
+    ),
+    before_agent_callback=before_agent,
+    after_agent_callback=after_agent,
+    # Static prompt goes first as the system instruction and is byte-identical
+    # on every turn, so Gemini can reuse it as a cached prefix. Only the
+    # per-turn timestamp is templated.
+    static_instruction=STATIC_INSTRUCTION,
+    instruction="Current time: {_time}",
     tools=[preload_memory, load_memory],
 )
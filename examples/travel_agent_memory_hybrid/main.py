@@ -24,6 +24,7 @@ This provides the complete two-tier memory architecture with both:
 - LLM-controlled memory (explicit search, create, update, delete)
 """
 
+import functools
 import os
 from urllib.parse import urlparse
 
@@ -40,7 +41,20 @@ from adk_redis.sessions import RedisWorkingMemorySessionServiceConfig
 
 load_dotenv()
 
+# Service settings, read from the environment once at import
+_NAMESPACE = os.getenv("NAMESPACE", "travel_agent_memory_hybrid")
+_MEMORY_SERVER_URL = os.getenv("MEMORY_SERVER_URL", "http://localhost:8088")
+_MODEL_NAME = os.getenv("REDIS_MEMORY_MODEL_NAME", "gpt-4o")
+_CONTEXT_WINDOW = int(os.getenv("REDIS_MEMORY_CONTEXT_WINDOW", "8000"))
+_EXTRACTION_STRATEGY = os.getenv("REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete")
+_RECENCY_BOOST = (
+    os.getenv("REDIS_MEMORY_RECENCY_BOOST", "true").lower() == "true"
+)
+_SEMANTIC_WEIGHT = float(os.getenv("REDIS_MEMORY_SEMANTIC_WEIGHT", "0.7"))
+_RECENCY_WEIGHT = float(os.getenv("REDIS_MEMORY_RECENCY_WEIGHT", "0.3"))
+
 
+@functools.lru_cache(maxsize=16)
 def parse_base_url(uri: str) -> str:
   """Parse URI to extract base URL."""
   parsed = urlparse(uri)
@@ -52,36 +66,41 @@ def parse_base_url(uri: str) -> str:
   )
 
 
-def redis_session_factory(uri: str, **kwargs):
-  """Factory function for creating RedisWorkingMemorySessionService from URI."""
+# Configs are built and validated once per distinct URI; the services only
+# read them, so one instance can back every service created for that URI.
+@functools.lru_cache(maxsize=16)
+def _session_config(uri: str) -> RedisWorkingMemorySessionServiceConfig:
   base_url = parse_base_url(uri)
-  config = RedisWorkingMemorySessionServiceConfig(
+  return RedisWorkingMemorySessionServiceConfig(
       api_base_url=base_url,
-      default_namespace=os.getenv("NAMESPACE", "travel_agent_memory_hybrid"),
-      model_name=os.getenv("REDIS_MEMORY_MODEL_NAME", "gpt-4o"),
-      context_window_max=int(os.getenv("REDIS_MEMORY_CONTEXT_WINDOW", "8000")),
-      extraction_strategy=os.getenv(
-          "REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete"
-      ),
+      default_namespace=_NAMESPACE,
+      model_name=_MODEL_NAME,
+      context_window_max=_CONTEXT_WINDOW,
+      extraction_strategy=_EXTRACTION_STRATEGY,
   )
-  return RedisWorkingMemorySessionService(config=config)
 
 
-def redis_memory_factory(uri: str, **kwargs):
-  """Factory function for creating RedisLongTermMemoryService from URI."""
+@functools.lru_cache(maxsize=16)
+def _memory_config(uri: str) -> RedisLongTermMemoryServiceConfig:
   base_url = parse_base_url(uri)
-  config = RedisLongTermMemoryServiceConfig(
+  return RedisLongTermMemoryServiceConfig(
       api_base_url=base_url,
-      default_namespace=os.getenv("NAMESPACE", "travel_agent_memory_hybrid"),
-      extraction_strategy=os.getenv(
-          "REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete"
-      ),
-      recency_boost=os.getenv("REDIS_MEMORY_RECENCY_BOOST", "true").lower()
-      == "true",
-      semantic_weight=float(os.getenv("REDIS_MEMORY_SEMANTIC_WEIGHT", "0.7")),
-      recency_weight=float(os.getenv("REDIS_MEMORY_RECENCY_WEIGHT", "0.3")),
+      default_namespace=_NAMESPACE,
+      extraction_strategy=_EXTRACTION_STRATEGY,
+      recency_boost=_RECENCY_BOOST,
+      semantic_weight=_SEMANTIC_WEIGHT,
+      recency_weight=_RECENCY_WEIGHT,
   )
-  return RedisLongTermMemoryService(config=config)
+
+
+def redis_session_factory(uri: str, **kwargs):
+  """Factory function for creating RedisWorkingMemorySessionService from URI."""
+  return RedisWorkingMemorySessionService(config=_session_config(uri))
+
+
+def redis_memory_factory(uri: str, **kwargs):
+  """Factory function for creating RedisLongTermMemoryService from URI."""
+  return RedisLongTermMemoryService(config=_memory_config(uri))
 
 
 # Register service factories
@@ -90,11 +109,7 @@ registry.register_session_service("redis-working-memory", redis_session_factory)
 registry.register_memory_service("redis-long-term-memory", redis_memory_factory)
 
 # Build URIs from environment
-server_url = (
-    os.getenv("MEMORY_SERVER_URL", "http://localhost:8088")
-    .replace("http://", "")
-    .replace("https://", "")
-)
+server_url = _MEMORY_SERVER_URL.replace("http://", "").replace("https://", "")
 SESSION_SERVICE_URI = f"redis-working-memory://{server_url}"
 MEMORY_SERVICE_URI = f"redis-long-term-memory://{server_url}"
 
@@ -109,20 +124,16 @@ app: FastAPI = get_fast_api_app(
 
 if __name__ == "__main__":
   port = int(os.environ.get("PORT", 8080))
-  namespace = os.getenv("NAMESPACE", "travel_agent_memory_hybrid")
-  server = os.getenv("MEMORY_SERVER_URL", "http://localhost:8088")
-  extraction = os.getenv("REDIS_MEMORY_EXTRACTION_STRATEGY", "discrete")
-  context_window = os.getenv("REDIS_MEMORY_CONTEXT_WINDOW", "8000")
 
   print(
       f"""
 Travel Agent Hybrid (adk-redis)
 ===============================
 ADK Server:          http://localhost:{port}
-Memory Server:       {server}
-Namespace:           {namespace}
-Extraction Strategy: {extraction}
-Context Window:      {context_window} tokens
+Memory Server:       {_MEMORY_SERVER_URL}
+Namespace:           {_NAMESPACE}
+Extraction Strategy: {_EXTRACTION_STRATEGY}
+Context Window:      {_CONTEXT_WINDOW} tokens
 
 Services (Framework-Managed):
   - Session:  RedisWorkingMemorySessionService (auto-summarization)
@@ -139,4 +150,11 @@ Hybrid Architecture:
   - Best of both worlds: automatic + explicit memory management
 """
   )
-  uvicorn.run(app, host="0.0.0.0", port=port)
+  # Multiple workers need an import string so each process builds the app
+  workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+  uvicorn.run(
+      "main:app" if workers > 1 else app,
+      host="0.0.0.0",
+      port=port,
+      workers=workers,
+  )
@@ -14,8 +14,21 @@
 
 """Custom tools for the travel agent."""
 
-from tools.calendar_export import CalendarExportTool
-from tools.itinerary_planner import ItineraryPlannerTool
-from tools.tavily_search import TavilySearchTool
+import importlib
+from typing import Any
 
 __all__ = ["TavilySearchTool", "CalendarExportTool", "ItineraryPlannerTool"]
+
+# Tools are imported on first access so that importing one tool does not
+# pull in the others' dependencies (e.g. redis for TavilySearchTool).
+_TOOL_MODULES = {
+    "CalendarExportTool": "tools.calendar_export",
+    "ItineraryPlannerTool": "tools.itinerary_planner",
+    "TavilySearchTool": "tools.tavily_search",
+}
+
+
+def __getattr__(name: str) -> Any:
+  if name in _TOOL_MODULES:
+    return getattr(importlib.import_module(_TOOL_MODULES[name]), name)
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -19,13 +19,36 @@ Google Calendar, Outlook, Apple Calendar, and other calendar applications.
 """
 
 from datetime import datetime
+import os
 from typing import Any
-from uuid import uuid4
+from uuid import UUID
 
 from google import genai
 from google.adk.tools import BaseTool
 from google.adk.tools.tool_context import ToolContext
 
+# Fixed VCALENDAR prologue and epilogue. RFC 5545 ends every content line,
+# including the last, with CRLF.
+_ICS_PROLOGUE = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//ADK-Redis Travel Agent//EN\r\n"
+    "CALSCALE:GREGORIAN\r\n"
+    "METHOD:PUBLISH\r\n"
+)
+_ICS_EPILOGUE = "END:VCALENDAR\r\n"
+
+# Characters that must be escaped in ICS text values, applied in one
+# str.translate pass
+_ICS_ESCAPES = str.maketrans(
+    {
+        "\\": "\\\\",  # Backslash
+        ";": "\\;",  # Semicolon
+        ",": "\\,",  # Comma
+        "\n": "\\n",  # Newline
+    }
+)
+
 
 class CalendarExportTool(BaseTool):
   """Tool for exporting travel itineraries to ICS calendar format.
@@ -141,44 +164,53 @@ class CalendarExportTool(BaseTool):
     Returns:
         ICS file content as string
     """
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//ADK-Redis Travel Agent//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-    ]
-
-    for event in events:
-      lines.extend(self._generate_event(event))
-
-    lines.append("END:VCALENDAR")
-
-    return "\n".join(lines)
-
-  def _generate_event(self, event: dict[str, str]) -> list[str]:
+    # Draw randomness for every event UID in one os.urandom call rather
+    # than one uuid4() (and getrandom syscall) per event.
+    raw = os.urandom(16 * len(events))
+    uids = (
+        str(UUID(bytes=raw[i : i + 16], version=4))
+        for i in range(0, len(raw), 16)
+    )
+    # Itinerary events mostly share boundaries (one activity ends where the
+    # next begins), so parse each distinct date string once per export.
+    distinct = {d for e in events for d in (e["start_date"], e["end_date"])}
+    dates = {d: self._parse_datetime(d) for d in distinct}
+    # DTSTAMP is the export time, shared by every event in the file
+    dtstamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    # Each event block ends in CRLF, so the file is the prebuilt prologue,
+    # the joined blocks, and the epilogue.
+    events_ics = "".join(
+        self._generate_event(e, uid, dates, dtstamp)
+        for e, uid in zip(events, uids)
+    )
+    return _ICS_PROLOGUE + events_ics + _ICS_EPILOGUE
+
+  def _generate_event(
+      self,
+      event: dict[str, str],
+      uid: str,
+      dates: dict[str, str],
+      dtstamp: str,
+  ) -> str:
     """Generate ICS VEVENT block for a single event.
 
     Args:
         event: Event dictionary with title, start_date, end_date, location, description
+        uid: Unique identifier for the event
+        dates: ICS formatted datetimes keyed by their ISO 8601 source string
+        dtstamp: ICS formatted UTC export timestamp
 
     Returns:
-        List of ICS lines for this event
+        ICS VEVENT block for this event, ending in CRLF
     """
-    # Generate unique ID for this event
-    uid = str(uuid4())
-
-    # Parse dates and convert to ICS format (YYYYMMDDTHHMMSS)
-    start_dt = self._parse_datetime(event["start_date"])
-    end_dt = self._parse_datetime(event["end_date"])
-
-    # Current timestamp for DTSTAMP
-    now = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    # Dates already converted to ICS format (YYYYMMDDTHHMMSS)
+    start_dt = dates[event["start_date"]]
+    end_dt = dates[event["end_date"]]
 
     lines = [
         "BEGIN:VEVENT",
         f"UID:{uid}",
-        f"DTSTAMP:{now}",
+        f"DTSTAMP:{dtstamp}",
         f"DTSTART:{start_dt}",
         f"DTEND:{end_dt}",
         f"SUMMARY:{self._escape_text(event['title'])}",
@@ -191,9 +223,9 @@ class CalendarExportTool(BaseTool):
     if event.get("description"):
       lines.append(f"DESCRIPTION:{self._escape_text(event['description'])}")
 
-    lines.append("END:VEVENT")
+    lines.append("END:VEVENT\r\n")
 
-    return lines
+    return "\r\n".join(lines)
 
   def _parse_datetime(self, dt_string: str) -> str:
     """Parse ISO 8601 datetime string to ICS format.
@@ -204,6 +236,14 @@ class CalendarExportTool(BaseTool):
     Returns:
         ICS formatted datetime (e.g., '20260315T100000')
     """
+    # Fast path: the C-implemented ISO parser handles the canonical forms
+    # (date only, with or without a UTC offset) without strptime's
+    # format-string parsing.
+    try:
+      return datetime.fromisoformat(dt_string).strftime("%Y%m%dT%H%M%S")
+    except ValueError:
+      pass
+
     # Try parsing with timezone info first
     for fmt in [
         "%Y-%m-%dT%H:%M:%S%z",  # With timezone
@@ -229,9 +269,4 @@ class CalendarExportTool(BaseTool):
         Escaped text safe for ICS format
     """
     # ICS requires escaping of special characters
-    text = text.replace("\\", "\\\\")  # Backslash
-    text = text.replace(";", "\\;")  # Semicolon
-    text = text.replace(",", "\\,")  # Comma
-    text = text.replace("\n", "\\n")  # Newline
-
-    return text
+    return text.translate(_ICS_ESCAPES)
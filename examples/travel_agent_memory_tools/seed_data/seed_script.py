@@ -24,9 +24,11 @@ Usage:
 
 Environment variables:
     MEMORY_SERVER_URL: Agent Memory Server URL (default: http://localhost:8088)
+    SEED_CONCURRENCY: Maximum users seeded at the same time (default: 16)
 """
 
 import asyncio
+import importlib.util
 import json
 import os
 from pathlib import Path
@@ -35,63 +37,78 @@ import httpx
 
 
 async def seed_user_memories(
+    client: httpx.AsyncClient,
     user_id: str,
     preferences: list[str],
     namespace: str = "travel_agent_memory_tools",
     base_url: str = "http://localhost:8088",
+    name: str | None = None,
 ):
   """Seed memories for a user.
 
+  Output for the user is printed in one block once the request completes,
+  so users seeded concurrently do not interleave.
+
   Args:
+      client: Shared HTTP client; its pooled connections are reused across
+          users
       user_id: User identifier
       preferences: List of preference strings to store
       namespace: Memory namespace
       base_url: Agent Memory Server URL
+      name: Display name for the user (defaults to user_id)
   """
-  async with httpx.AsyncClient() as client:
-    success_count = 0
-    fail_count = 0
-
-    for idx, pref in enumerate(preferences):
-      # Create memory record with required fields
-      memory_record = {
+  header = (
+      f"👤 Seeding user: {name or user_id} ({user_id})\n"
+      f"   Preferences: {len(preferences)}"
+  )
+  if not preferences:
+    print(header + "\n")
+    return 0, 0
+
+  # Create memory records with required fields
+  memory_records = [
+      {
           "id": f"{user_id}_{namespace}_pref_{idx}",  # Required: unique ID for deduplication
           "text": pref,  # Required: the actual memory text
           "user_id": user_id,  # Optional: for user isolation
           "namespace": namespace,  # Optional: for namespace isolation
       }
+      for idx, pref in enumerate(preferences)
+  ]
+
+  # Send all of the user's preferences in one request instead of one
+  # round trip per preference
+  payload = {
+      "memories": memory_records,
+      "deduplicate": True,
+  }
+
+  try:
+    response = await client.post(
+        f"{base_url}/v1/long-term-memory/",
+        json=payload,
+    )
+  except Exception as e:
+    print(f"{header}\n  ❌ Error: {e}\n")
+    return 0, len(preferences)
+
+  if response.status_code not in (200, 201):
+    print(
+        f"{header}\n  ❌ Failed ({response.status_code})\n"
+        f"     Response: {response.text}\n"
+    )
+    return 0, len(preferences)
 
-      # Wrap in the expected payload format
-      payload = {
-          "memories": [memory_record],
-          "deduplicate": True,
-      }
-
-      try:
-        response = await client.post(
-            f"{base_url}/v1/long-term-memory/",
-            json=payload,
-            timeout=10.0,
-        )
-
-        if response.status_code in (200, 201):
-          print(f"  ✅ {pref}")
-          success_count += 1
-        else:
-          print(f"  ❌ Failed ({response.status_code}): {pref}")
-          print(f"     Response: {response.text}")
-          fail_count += 1
-      except Exception as e:
-        print(f"  ❌ Error: {pref} - {e}")
-        fail_count += 1
-
-    return success_count, fail_count
+  print("\n".join([header, *(f"  ✅ {pref}" for pref in preferences), ""]))
+  return len(preferences), 0
 
 
 async def main():
   """Load users.json and seed all users."""
   # Get configuration
   base_url = os.getenv("MEMORY_SERVER_URL", "http://localhost:8088")
+  concurrency = int(os.getenv("SEED_CONCURRENCY", "16"))
   namespace = os.getenv("NAMESPACE", "travel_agent_memory_tools")
 
   # Load users file
@@ -114,24 +131,44 @@ async def main():
   print("=" * 80)
   print()
 
-  # Seed each user
-  total_success = 0
-  total_fail = 0
-
-  for user_id, data in users.items():
-    print(f"👤 Seeding user: {data['name']} ({user_id})")
-    print(f"   Preferences: {len(data['preferences'])}")
-
-    success, fail = await seed_user_memories(
-        user_id=user_id,
-        preferences=data["preferences"],
-        namespace=namespace,
-        base_url=base_url,
-    )
-
-    total_success += success
-    total_fail += fail
-    print()
+  # Seed users with a fixed pool of workers draining a queue, so at most
+  # SEED_CONCURRENCY requests are in flight and a large users.json neither
+  # swamps the server nor creates a coroutine per user up front. One client
+  # keeps a pool of keep-alive connections for all workers.
+  # With the optional h2 package installed (httpx[http2]), requests to an
+  # https:// server are multiplexed over one HTTP/2 connection. Plain
+  # http:// URLs stay on HTTP/1.1.
+  limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+  http2 = importlib.util.find_spec("h2") is not None
+  queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue()
+  for item in users.items():
+    queue.put_nowait(item)
+
+  async def worker(client: httpx.AsyncClient) -> tuple[int, int]:
+    success = fail = 0
+    while True:
+      try:
+        user_id, data = queue.get_nowait()
+      except asyncio.QueueEmpty:
+        return success, fail
+      user_success, user_fail = await seed_user_memories(
+          client,
+          user_id=user_id,
+          preferences=data["preferences"],
+          namespace=namespace,
+          base_url=base_url,
+          name=data["name"],
+      )
+      success += user_success
+      fail += user_fail
+
+  async with httpx.AsyncClient(
+      http2=http2, limits=limits, timeout=30.0
+  ) as client:
+    workers = max(1, min(concurrency, len(users)))
+    results = await asyncio.gather(*(worker(client) for _ in range(workers)))
+  total_success = sum(success for success, _ in results)
+  total_fail = sum(fail for _, fail in results)
 
   # Display summary
   print("=" * 80)
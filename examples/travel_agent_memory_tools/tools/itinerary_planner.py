@@ -5,6 +5,8 @@ This tool helps structure multi-day travel itineraries with activities,
 meals, and logistics organized by day and time.
 """
 
+from datetime import datetime
+from datetime import timedelta
 from typing import Any
 
 from google.adk.tools import BaseTool
@@ -20,6 +22,23 @@ class ItineraryPlannerTool(BaseTool):
   that can be easily exported to calendar or shared with users.
   """
 
+  # Activity category -> summary emoji, built once at import
+  _CATEGORY_EMOJI = {
+      "sightseeing": "🏛️",
+      "dining": "🍽️",
+      "breakfast": "🥐",
+      "lunch": "🥗",
+      "dinner": "🍷",
+      "transport": "🚗",
+      "flight": "✈️",
+      "hotel": "🏨",
+      "activity": "🎯",
+      "shopping": "🛍️",
+      "entertainment": "🎭",
+      "relaxation": "🧘",
+      "nature": "🌳",
+  }
+
   def __init__(self, **kwargs: Any):
     super().__init__(
         name="plan_itinerary",
@@ -206,12 +225,19 @@ class ItineraryPlannerTool(BaseTool):
 
         # Create calendar event
         start_datetime = f"{date}T{time}:00"
-        # Calculate end time (add duration)
-        end_minutes = hour * 60 + minute + duration
-        end_hour = (end_minutes // 60) % 24
-        end_minute = end_minutes % 60
-        end_time = f"{end_hour:02d}:{end_minute:02d}"
-        end_datetime = f"{date}T{end_time}:00"
+        # Calculate end time (add duration); activities running past
+        # midnight end on the following day
+        try:
+          end_datetime = (
+              datetime.fromisoformat(start_datetime)
+              + timedelta(minutes=duration)
+          ).isoformat()
+        except (TypeError, ValueError):
+          # Unparseable date or time: keep the end on the same day
+          end_minutes = hour * 60 + minute + int(duration)
+          end_hour = (end_minutes // 60) % 24
+          end_minute = end_minutes % 60
+          end_datetime = f"{date}T{end_hour:02d}:{end_minute:02d}:00"
 
         calendar_events.append(
             {
@@ -235,19 +261,4 @@ class ItineraryPlannerTool(BaseTool):
 
   def _get_category_emoji(self, category: str) -> str:
     """Get emoji for activity category."""
-    emoji_map = {
-        "sightseeing": "🏛️",
-        "dining": "🍽️",
-        "breakfast": "🥐",
-        "lunch": "🥗",
-        "dinner": "🍷",
-        "transport": "🚗",
-        "flight": "✈️",
-        "hotel": "🏨",
-        "activity": "🎯",
-        "shopping": "🛍️",
-        "entertainment": "🎭",
-        "relaxation": "🧘",
-        "nature": "🌳",
-    }
-    return emoji_map.get(category.lower(), "📌")
+    return self._CATEGORY_EMOJI.get(category.lower(), "📌")
@@ -22,23 +22,47 @@ Environment variables:
 - REDIS_URL: Optional, defaults to redis://localhost:6379
 """
 
+import asyncio
+import hashlib
+import importlib.util
 import json
 import os
 from typing import Any
 
+from google.adk.agents.readonly_context import ReadonlyContext
 from google.adk.tools import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
 from google.genai import types
 
 try:
   from redis import Redis
+  from redis.asyncio import Redis as AsyncRedis
 except ImportError:
   Redis = None  # type: ignore
+  AsyncRedis = None  # type: ignore
 
 try:
   import httpx
 except ImportError:
   httpx = None  # type: ignore
 
+# orjson is optional; it (de)serializes cached results faster than json
+try:
+  import orjson
+
+  _json_loads = orjson.loads
+
+  def _json_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+except ImportError:
+  _json_loads = json.loads
+  _json_dumps = json.dumps
+
+# Seconds to cache a search that returned no results, so repeats of the
+# query skip the API without pinning an empty answer for the full TTL
+_EMPTY_RESULTS_TTL = 60
+
 
 class TavilySearchTool(BaseTool):
   """Web search tool using Tavily API with Redis caching.
@@ -91,21 +115,69 @@ class TavilySearchTool(BaseTool):
           "Install with: pip install httpx"
       )
 
-    # Setup Redis client for caching
-    redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+    # Setup Redis caching. Reachability is checked once here with a
+    # short-lived sync connection; searches use an asyncio client, created in
+    # the running event loop (see _bind_loop), so cache reads and writes
+    # never block it.
+    self.redis_url = redis_url or os.getenv(
+        "REDIS_URL", "redis://localhost:6379"
+    )
     try:
-      self.redis_client = Redis.from_url(redis_url, decode_responses=True)
-      self.redis_client.ping()
+      with Redis.from_url(self.redis_url) as probe:
+        probe.ping()
       self.cache_enabled = True
     except Exception as e:
       print(f"Warning: Redis caching disabled - {e}")
-      self.redis_client = None
       self.cache_enabled = False
+    self.redis_client: AsyncRedis | None = None
+    self._loop: asyncio.AbstractEventLoop | None = None
 
     self.max_results = max_results
     self.cache_ttl = cache_ttl
     self.tavily_api_url = "https://api.tavily.com/search"
 
+    # Request fields that are the same for every search; each call adds
+    # only its query
+    self._base_payload = {
+        "max_results": max_results,
+        # Only title/content/url are kept; don't let Tavily send more
+        "include_answer": False,
+        "include_raw_content": False,
+        "include_images": False,
+    }
+
+    # Pooled HTTP client, created per event loop (see _bind_loop), so repeat
+    # searches reuse the TLS connection to Tavily
+    self._http: httpx.AsyncClient | None = None
+    # Live searches in progress, keyed by cache key, so concurrent calls for
+    # the same query share one Tavily request.
+    self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
+  def _bind_loop(self) -> None:
+    """Create the async clients for the running event loop.
+
+    Async connections only work on the loop that opened them, and each
+    asyncio.run() or sync Runner.run() starts a new loop, so clients from
+    an earlier loop are replaced rather than reused.
+    """
+    loop = asyncio.get_running_loop()
+    if loop is self._loop:
+      return
+    self._loop = loop
+    self._inflight = {}
+    # HTTP/2 is used when h2 is installed. The API key goes in a default
+    # header instead of every request body.
+    self._http = httpx.AsyncClient(
+        headers={"Authorization": f"Bearer {self.tavily_api_key}"},
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        http2=importlib.util.find_spec("h2") is not None,
+    )
+    if self.cache_enabled:
+      self.redis_client = AsyncRedis.from_url(
+          self.redis_url, decode_responses=True
+      )
+
   def _get_declaration(self) -> types.FunctionDeclaration:
     """Return the tool declaration for ADK."""
     return types.FunctionDeclaration(
@@ -142,33 +214,58 @@ class TavilySearchTool(BaseTool):
           "error": "Search query is required",
       }
 
-    # Check cache first
-    if self.cache_enabled:
-      cache_key = f"tavily_search:{query}"
-      cached_result = self.redis_client.get(cache_key)  # type: ignore
+    # Queries can be long, so key the cache on a fixed-size digest of the
+    # query rather than the raw text
+    cache_key = (
+        "tavily_search:"
+        + hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+    )
+
+    self._bind_loop()
+
+    # Check cache first; if Redis is unavailable, search live
+    cached_result = None
+    if self.redis_client is not None:
+      try:
+        cached_result = await self.redis_client.get(cache_key)
+      except Exception as e:
+        print(f"Warning: cache read failed - {e}")
       if cached_result:
         print(f"🔍 Web search (cached): {query}")
         return {
             "success": True,
-            "results": json.loads(cached_result),
+            "results": _json_loads(cached_result),
             "cached": True,
         }
 
-    # Perform search via Tavily API
+    # Join an identical search that is already in flight. The shared task is
+    # shielded so one caller being cancelled does not cancel it for others.
+    task = self._inflight.get(cache_key)
+    if task is None:
+      task = asyncio.ensure_future(self._search(query, cache_key))
+      self._inflight[cache_key] = task
+      task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+    return await asyncio.shield(task)
+
+  async def _search(self, query: str, cache_key: str) -> dict[str, Any]:
+    """Query the Tavily API and cache the results.
+
+    Args:
+        query: The search query
+        cache_key: Redis key to cache the results under
+
+    Returns:
+        dict with search results
+    """
     print(f"🔍 Web search (live): {query}")
+    assert self._http is not None  # set by _bind_loop() in run_async()
     try:
-      async with httpx.AsyncClient() as client:
-        response = await client.post(
-            self.tavily_api_url,
-            json={
-                "api_key": self.tavily_api_key,
-                "query": query,
-                "max_results": self.max_results,
-            },
-            timeout=30.0,
-        )
-        response.raise_for_status()
-        data = response.json()
+      response = await self._http.post(
+          self.tavily_api_url,
+          json={**self._base_payload, "query": query},
+      )
+      response.raise_for_status()
+      data = _json_loads(response.content)
 
       # Extract and format results
       results = []
@@ -181,14 +278,16 @@ class TavilySearchTool(BaseTool):
             }
         )
 
-      # Cache the results
-      if self.cache_enabled and results:
-        cache_key = f"tavily_search:{query}"
-        self.redis_client.set(  # type: ignore
-            cache_key,
-            json.dumps(results),
-            ex=self.cache_ttl,
-        )
+      # Cache the results; empty ones only briefly
+      if self.redis_client is not None:
+        try:
+          await self.redis_client.set(
+              cache_key,
+              _json_dumps(results),
+              ex=self.cache_ttl if results else _EMPTY_RESULTS_TTL,
+          )
+        except Exception as e:
+          print(f"Warning: cache write failed - {e}")
 
       return {
           "success": True,
@@ -206,3 +305,38 @@ class TavilySearchTool(BaseTool):
           "success": False,
           "error": f"Error performing web search: {str(e)}",
       }
+
+  async def aclose(self) -> None:
+    """Close the pooled HTTP and Redis connections.
+
+    Clients belong to the loop they were created on; ones left over from an
+    earlier loop are dropped rather than closed.
+    """
+    if self._loop is asyncio.get_running_loop():
+      if self._http is not None:
+        await self._http.aclose()
+      if self.redis_client is not None:
+        await self.redis_client.aclose()
+    self._http = None
+    self.redis_client = None
+    self._loop = None
+
+
+class TavilySearchToolset(BaseToolset):
+  """Toolset wrapping a TavilySearchTool so its connections are closed.
+
+  ADK closes toolsets, not tools, when a Runner is closed or the API server
+  shuts down; add this to an agent instead of the bare tool.
+  """
+
+  def __init__(self, tool: TavilySearchTool):
+    super().__init__()
+    self._tool = tool
+
+  async def get_tools(
+      self, readonly_context: ReadonlyContext | None = None
+  ) -> list[BaseTool]:
+    return [self._tool]
+
+  async def close(self) -> None:
+    await self._tool.aclose()
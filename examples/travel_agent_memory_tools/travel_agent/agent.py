@@ -30,7 +30,6 @@ from google.adk.tools import load_memory
 from google.adk.tools import preload_memory
 from tools.calendar_export import CalendarExportTool
 from tools.itinerary_planner import ItineraryPlannerTool
-from tools.tavily_search import TavilySearchTool
 
 from adk_redis.tools.memory import CreateMemoryTool
 from adk_redis.tools.memory import DeleteMemoryTool
@@ -78,25 +77,23 @@ tools = [
 # Add Tavily web search tool if API key is available
 if os.getenv("TAVILY_API_KEY"):
   try:
+    # Imported only when enabled; it pulls in the redis client for caching.
+    from tools.tavily_search import TavilySearchTool
+    from tools.tavily_search import TavilySearchToolset
+
     tavily_tool = TavilySearchTool(
         max_results=5,
         cache_ttl=3600,  # 1 hour cache
     )
-    tools.append(tavily_tool)
+    # Wrapped in a toolset so ADK closes its connections on shutdown
+    tools.append(TavilySearchToolset(tavily_tool))
   except Exception as e:
     print(f"⚠️  Web search disabled: {e}")
 else:
   print("ℹ️  Web search disabled (TAVILY_API_KEY not set)")
 
 
-# Create the travel agent
-root_agent = Agent(
-    model="gemini-2.5-flash",
-    name="travel_agent",
-    description="AI travel planning assistant with memory, web search, and personalized recommendations",
-    tools=tools,
-    after_agent_callback=after_agent,
-    instruction="""You are an expert travel planning assistant with advanced memory and search capabilities.
+INSTRUCTION = """You are an expert travel planning assistant with advanced memory and search capabilities.
 
 ## First Interaction Protocol
 
@@ -177,5 +174,15 @@ Once you have their user_id, use it in ALL memory tool calls (search_memory, cre
 6. **End of conversation** → Automatic memory extraction via after_agent_callback
 
 Remember: You're not just a search engine - you're a personalized travel assistant who learns and remembers!
-""",
+"""
+
+
+# Create the travel agent
+root_agent = Agent(
+    model="gemini-2.5-flash",
+    name="travel_agent",
+    description="AI travel planning assistant with memory, web search, and personalized recommendations",
+    tools=tools,
+    after_agent_callback=after_agent,
+    static_instruction=INSTRUCTION,
 )
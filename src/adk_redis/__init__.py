@@ -25,6 +25,7 @@ Session Services:
 Search Tools:
     - RedisVectorSearchTool: Vector similarity search
     - RedisHybridSearchTool: Combined vector + BM25 search
+    - RedisMultiSearchTool: Vector, BM25, and range search in one round trip
     - RedisRangeSearchTool: Distance threshold search
     - RedisTextSearchTool: Full-text BM25 search
 
@@ -77,6 +78,7 @@ from adk_redis.tools import BaseRedisSearchTool
 from adk_redis.tools import RedisAggregatedHybridQueryConfig
 from adk_redis.tools import RedisHybridQueryConfig
 from adk_redis.tools import RedisHybridSearchTool
+from adk_redis.tools import RedisMultiSearchTool
 from adk_redis.tools import RedisRangeQueryConfig
 from adk_redis.tools import RedisRangeSearchTool
 from adk_redis.tools import RedisTextQueryConfig
@@ -118,6 +120,7 @@ __all__ = [
     # Search tools - implementations
     "RedisVectorSearchTool",
     "RedisHybridSearchTool",
+    "RedisMultiSearchTool",
     "RedisRangeSearchTool",
     "RedisTextSearchTool",
     # Search tools - config classes
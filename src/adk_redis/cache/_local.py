@@ -0,0 +1,146 @@
+# Copyright 2025 Redis, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process near-cache of recent semantic cache entries."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+from typing import Any, Optional
+
+import numpy as np
+
+
+class LocalVectorCache:
+  """Bounded, exact cosine-similarity cache held in process memory.
+
+  Keeps the embeddings of the most recently used cache entries as unit
+  vectors so a lookup is a single matrix-vector product. This lets repeat
+  and near-repeat prompts be answered without a Redis round trip; misses
+  fall through to the Redis-backed cache.
+  """
+
+  def __init__(self, maxsize: int, ttl: Optional[int] = None):
+    """Initialize the local cache.
+
+    Args:
+        maxsize: Maximum number of entries; least recently used entries are
+            evicted first.
+        ttl: Seconds an entry stays valid, mirroring the Redis TTL. None or
+            0 keeps entries until evicted.
+    """
+    self._maxsize = maxsize
+    self._ttl = ttl or None
+    # prompt -> (unit vector, response, expiry as a monotonic timestamp)
+    self._entries: OrderedDict[str, tuple[np.ndarray, str, float]] = (
+        OrderedDict()
+    )
+    # Stacked unit vectors for _keys, rebuilt lazily after mutations.
+    self._matrix: Optional[np.ndarray] = None
+    self._keys: list[str] = []
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def lookup(
+      self, vector: Any, distance_threshold: float
+  ) -> Optional[tuple[str, float]]:
+    """Find the closest cached entry within distance_threshold.
+
+    Args:
+        vector: The prompt embedding.
+        distance_threshold: Maximum cosine distance (1 - cosine similarity)
+            for a hit, matching Redis' COSINE metric.
+
+    Returns:
+        A (response, distance) tuple on a hit, otherwise None.
+    """
+    self._expire()
+    if not self._entries:
+      return None
+    if self._matrix is None:
+      self._keys = list(self._entries)
+      self._matrix = np.stack([self._entries[k][0] for k in self._keys])
+
+    query = _unit(vector)
+    if query.shape[0] != self._matrix.shape[1]:
+      return None
+    similarities = self._matrix @ query
+    best = int(np.argmax(similarities))
+    distance = float(1.0 - similarities[best])
+    if distance > distance_threshold:
+      return None
+
+    key = self._keys[best]
+    self._entries.move_to_end(key)
+    return self._entries[key][1], distance
+
+  def get(self, prompt: str) -> Optional[str]:
+    """Return the response cached for exactly this prompt, if any.
+
+    Needs no embedding, so callers can try it before vectorizing.
+    """
+    entry = self._entries.get(prompt)
+    if entry is None:
+      return None
+    if entry[2] <= time.monotonic():
+      del self._entries[prompt]
+      self._matrix = None
+      return None
+    self._entries.move_to_end(prompt)
+    return entry[1]
+
+  def add(
+      self,
+      prompt: str,
+      vector: Any,
+      response: str,
+      ttl: Optional[float] = None,
+  ) -> None:
+    """Add or refresh an entry, evicting the least recently used.
+
+    Args:
+        prompt: The prompt the entry answers.
+        vector: The prompt embedding.
+        response: The cached response.
+        ttl: Seconds this entry stays valid, overriding the cache's TTL.
+    """
+    ttl = ttl or self._ttl
+    expires_at = time.monotonic() + ttl if ttl else float("inf")
+    self._entries[prompt] = (_unit(vector), response, expires_at)
+    self._entries.move_to_end(prompt)
+    while len(self._entries) > self._maxsize:
+      self._entries.popitem(last=False)
+    self._matrix = None
+
+  def clear(self) -> None:
+    """Remove all entries."""
+    self._entries.clear()
+    self._matrix = None
+
+  def _expire(self) -> None:
+    now = time.monotonic()
+    expired = [k for k, (_, _, exp) in self._entries.items() if exp <= now]
+    for key in expired:
+      del self._entries[key]
+    if expired:
+      self._matrix = None
+
+
+def _unit(vector: Any) -> np.ndarray:
+  """Return vector as a float32 array with unit L2 norm."""
+  array = np.asarray(vector, dtype=np.float32).ravel()
+  norm = float(np.linalg.norm(array))
+  return array / norm if norm else array
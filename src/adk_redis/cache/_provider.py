@@ -18,16 +18,27 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from array import array
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
+import hashlib
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, TYPE_CHECKING
 
 from pydantic import BaseModel
 from pydantic import Field
 
+if TYPE_CHECKING:
+  from adk_redis.cache._local import LocalVectorCache
+
 logger = logging.getLogger(__name__)
 
+# Seconds a Redis hit is kept in the local near-cache. The entry's remaining
+# Redis TTL is unknown, so it is held only briefly rather than for a full
+# TTL that could outlive the Redis entry.
+_REDIS_HIT_LOCAL_TTL = 60
+
 
 @dataclass
 class CacheEntry:
@@ -63,6 +74,23 @@ class BaseCacheProvider(ABC):
     """Clear all entries from the cache."""
     pass
 
+  async def store_many(self, entries: list[tuple[str, str]]) -> None:
+    """Store several prompt-response pairs, e.g. to warm up the cache.
+
+    The default implementation stores each pair in turn; providers can
+    override it to batch the writes.
+    """
+    for prompt, response in entries:
+      await self.store(prompt, response)
+
+  async def prewarm(self, prompts: list[str]) -> None:
+    """Precompute lookup state for prompts expected to arrive soon.
+
+    The default implementation does nothing; providers that embed prompts
+    can override it to batch that work up front.
+    """
+    return None
+
   @abstractmethod
   async def close(self) -> None:
     """Close the cache provider and release resources."""
@@ -76,6 +104,17 @@ class RedisVLCacheProviderConfig(BaseModel):
   name: str = Field(default="adk_semantic_cache")
   ttl: int = Field(default=3600, ge=0)
   distance_threshold: float = Field(default=0.1, ge=0.0, le=2.0)
+  # Recent entries kept in process so repeat prompts skip the Redis round
+  # trip. 0 disables the local near-cache.
+  local_cache_size: int = Field(default=0, ge=0)
+  # Prompt embeddings kept in process so repeated prompts, and the store()
+  # that follows a check() miss, skip the vectorizer. Held as float32, so
+  # the default costs about 6 MB at 1536 dimensions. 0 disables.
+  embedding_cache_size: int = Field(default=1024, ge=0)
+  # Also store each response under a key derived from the exact prompt, so
+  # a repeated prompt is answered by one GET without being embedded. Costs
+  # an extra GET on every miss, so it is off by default.
+  exact_match: bool = Field(default=False)
 
 
 class RedisVLCacheProvider(BaseCacheProvider):
@@ -88,11 +127,15 @@ class RedisVLCacheProvider(BaseCacheProvider):
     except ImportError as e:
       raise ImportError(
           "redisvl is required for RedisVLCacheProvider. "
-          "Install it with: pip install redisvl>=0.4.0"
+          "Install it with: pip install redisvl>=0.5.0"
       ) from e
 
     self._config = config
     self._vectorizer = vectorizer
+    # Lookups and writes go through SemanticCache's async API, which awaits
+    # the redis.asyncio client directly instead of hopping to a worker
+    # thread per operation. That client is created lazily and only works on
+    # the event loop that made it; see _bind_loop().
     self._cache = SemanticCache(
         name=config.name,
         redis_url=config.redis_url,
@@ -101,15 +144,126 @@ class RedisVLCacheProvider(BaseCacheProvider):
         vectorizer=vectorizer,
         overwrite=True,  # Overwrite existing index if schema doesn't match
     )
+    # LRU of prompt embeddings keyed by a BLAKE2b digest of the prompt,
+    # filled by prewarm() and on first use, shared by check() and store().
+    # Stored as packed float32 rather than lists of Python floats, which
+    # take about six times the memory.
+    self._vectors: OrderedDict[bytes, array[float]] = OrderedDict()
+    self._loop: Optional[asyncio.AbstractEventLoop] = None
+    self._local: Optional[LocalVectorCache] = None
+    if config.local_cache_size:
+      from adk_redis.cache._local import LocalVectorCache
+
+      self._local = LocalVectorCache(config.local_cache_size, ttl=config.ttl)
+
+  @staticmethod
+  def _vector_key(prompt: str) -> bytes:
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+
+  def _exact_key(self, key: bytes) -> str:
+    # Plain string keys outside the search index; clear() deletes them
+    return f"{self._config.name}:exact:{key.hex()}"
+
+  def _bind_loop(self) -> None:
+    """Drop SemanticCache's async client if another event loop made it.
+
+    Each asyncio.run() (and each sync Runner.run()) uses a new loop, and
+    redis.asyncio connections cannot be used or closed from any loop but
+    their own. SemanticCache rebuilds the client and async index lazily.
+    """
+    loop = asyncio.get_running_loop()
+    if loop is self._loop:
+      return
+    if self._loop is not None:
+      self._cache._aindex = None
+      self._cache._async_redis_client = None
+    self._loop = loop
+
+  async def _redis(self) -> Any:
+    """Return SemanticCache's async client for plain key commands."""
+    self._bind_loop()
+    return await self._cache._get_async_redis_client()
+
+  def _remember_vector(self, key: bytes, vector: list[float]) -> None:
+    self._vectors[key] = array("f", vector)
+    self._vectors.move_to_end(key)
+    while len(self._vectors) > self._config.embedding_cache_size:
+      self._vectors.popitem(last=False)
+
+  async def prewarm(self, prompts: list[str]) -> None:
+    """Embed prompts in a single batched vectorizer call."""
+    keys = {self._vector_key(p): p for p in prompts}
+    pending = {k: p for k, p in keys.items() if k not in self._vectors}
+    if not pending or not self._config.embedding_cache_size:
+      return
+    vectors = await asyncio.to_thread(
+        self._vectorizer.embed_many,
+        list(pending.values()),
+        batch_size=len(pending),
+    )
+    for key, vector in zip(pending, vectors):
+      self._remember_vector(key, vector)
+    logger.debug("Prewarmed %d prompt embeddings", len(pending))
+
+  async def _get_vector(self, prompt: str, key: bytes) -> Optional[list[float]]:
+    """Return the prompt embedding, computing and caching it on a miss.
+
+    With both the embedding cache and the local near-cache disabled, None
+    is returned and SemanticCache embeds the prompt itself.
+    """
+    cached = self._vectors.get(key)
+    if cached is not None:
+      self._vectors.move_to_end(key)
+      return cached.tolist()
+    if not self._config.embedding_cache_size and self._local is None:
+      return None
+
+    vector: list[float] = await asyncio.to_thread(
+        self._vectorizer.embed, prompt
+    )
+    if self._config.embedding_cache_size:
+      self._remember_vector(key, vector)
+    return vector
 
   async def check(self, prompt: str, **kwargs: Any) -> Optional[CacheEntry]:
     """Check for a semantically similar prompt in the cache."""
-    result = await asyncio.to_thread(self._cache.check, prompt=prompt)
+    self._bind_loop()
+    if self._local is not None:
+      local_response = self._local.get(prompt)
+      if local_response is not None:
+        logger.debug("Local cache hit for prompt: %s", prompt[:50])
+        return CacheEntry(prompt=prompt, response=local_response, distance=0.0)
+
+    key = self._vector_key(prompt)
+    if self._config.exact_match:
+      client = await self._redis()
+      exact = await client.get(self._exact_key(key))
+      if exact is not None:
+        logger.debug("Exact cache hit for prompt: %s", prompt[:50])
+        if isinstance(exact, bytes):
+          exact = exact.decode("utf-8")
+        return CacheEntry(prompt=prompt, response=exact, distance=0.0)
+
+    vector = await self._get_vector(prompt, key)
+    if self._local is not None:
+      local_hit = self._local.lookup(vector, self._config.distance_threshold)
+      if local_hit:
+        logger.debug("Local cache hit for prompt: %s", prompt[:50])
+        response, distance = local_hit
+        return CacheEntry(prompt=prompt, response=response, distance=distance)
+
+    result = await self._cache.acheck(prompt=prompt, vector=vector)
     if result:
       logger.debug("Cache hit for prompt: %s", prompt[:50])
+      response = result[0]["response"]
+      if self._local is not None:
+        ttl = min(
+            self._config.ttl or _REDIS_HIT_LOCAL_TTL, _REDIS_HIT_LOCAL_TTL
+        )
+        self._local.add(prompt, vector, response, ttl=ttl)
       return CacheEntry(
           prompt=prompt,
-          response=result[0]["response"],
+          response=response,
           distance=result[0].get("vector_distance"),
       )
     logger.debug("Cache miss for prompt: %s", prompt[:50])
@@ -123,16 +277,82 @@ class RedisVLCacheProvider(BaseCacheProvider):
       **kwargs: Any,
   ) -> None:
     """Store a prompt-response pair in the cache."""
-    await asyncio.to_thread(self._cache.store, prompt=prompt, response=response)
+    self._bind_loop()
+    key = self._vector_key(prompt)
+    vector = await self._get_vector(prompt, key)
+    # The semantic entry and the exact key go out on separate connections,
+    # so send both before waiting on either
+    writes = [
+        self._cache.astore(prompt=prompt, response=response, vector=vector)
+    ]
+    if self._config.exact_match:
+      client = await self._redis()
+      writes.append(
+          client.set(
+              self._exact_key(key), response, ex=self._config.ttl or None
+          )
+      )
+    await asyncio.gather(*writes)
+    if self._local is not None:
+      self._local.add(prompt, vector, response)
     logger.debug("Stored response for prompt: %s", prompt[:50])
 
+  async def store_many(self, entries: list[tuple[str, str]]) -> None:
+    """Store prompt-response pairs with batched embedding and writes.
+
+    Prompts are embedded in one vectorizer call, every exact key is set in
+    a single pipeline, and the semantic entries are written concurrently.
+    """
+    if not entries:
+      return
+    self._bind_loop()
+    await self.prewarm([prompt for prompt, _ in entries])
+    keys = [self._vector_key(prompt) for prompt, _ in entries]
+    vectors = [
+        await self._get_vector(prompt, key)
+        for (prompt, _), key in zip(entries, keys)
+    ]
+    writes = [
+        self._cache.astore(prompt=prompt, response=response, vector=vector)
+        for (prompt, response), vector in zip(entries, vectors)
+    ]
+    if self._config.exact_match:
+      client = await self._redis()
+      pipe = client.pipeline(transaction=False)
+      for (_, response), key in zip(entries, keys):
+        pipe.set(self._exact_key(key), response, ex=self._config.ttl or None)
+      writes.append(pipe.execute())
+    await asyncio.gather(*writes)
+    if self._local is not None:
+      for (prompt, response), vector in zip(entries, vectors):
+        self._local.add(prompt, vector, response)
+    logger.debug("Stored %d responses", len(entries))
+
   async def clear(self, **kwargs: Any) -> None:
     """Clear all entries from the cache."""
-    await asyncio.to_thread(self._cache.clear)
+    self._bind_loop()
+    await self._cache.aclear()
+    # Older redisvl versions clear only indexed documents, so sweep the
+    # exact-match keys here. Always done, since an earlier run may have
+    # written them with exact_match enabled.
+    client = await self._redis()
+    batch = []
+    async for key in client.scan_iter(
+        match=f"{self._config.name}:exact:*", count=1000
+    ):
+      batch.append(key)
+      if len(batch) >= 1000:
+        await client.delete(*batch)
+        batch = []
+    if batch:
+      await client.delete(*batch)
+    if self._local is not None:
+      self._local.clear()
     logger.info("Cache cleared")
 
   async def close(self) -> None:
     """Close the cache provider and release resources."""
-    if hasattr(self._cache, "_index") and hasattr(self._cache._index, "client"):
-      await asyncio.to_thread(self._cache._index.client.close)
+    # Closes the async index and the sync client used for index setup
+    self._bind_loop()
+    await self._cache.adisconnect()
     logger.debug("RedisVL cache provider closed")
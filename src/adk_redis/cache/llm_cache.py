@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 import logging
 from typing import Optional
 
@@ -30,6 +31,14 @@ from ._provider import BaseCacheProvider
 
 logger = logging.getLogger("google_adk." + __name__)
 
+# Cache key of the model call in flight, as (invocation ID, key). ADK runs
+# the before and after model callbacks in the same task, so the key is
+# handed over without shared state, and a call that never reaches its
+# after callback leaves nothing behind but this one slot.
+_pending_prompt: ContextVar[Optional[tuple[str, str]]] = ContextVar(
+    "adk_redis_pending_prompt", default=None
+)
+
 
 class LLMResponseCacheConfig(BaseModel):
   """Configuration for LLM response caching.
@@ -68,8 +77,15 @@ class LLMResponseCache:
     """
     self._provider = provider
     self._config = config or LLMResponseCacheConfig()
-    # Track pending prompts by session ID for after_model_callback
-    self._pending_prompts: dict[str, str] = {}
+    # Key layout for requests with a session, fixed by the config at init
+    scopes = [
+        ("app:{app_name}", self._config.include_app_name),
+        ("user:{user_id}", self._config.include_user_id),
+        ("session:{session_id}", self._config.include_session_id),
+    ]
+    self._key_template = " | ".join(
+        [field for field, enabled in scopes if enabled] + ["{prompt}"]
+    )
 
   def _is_first_message(self, callback_context: CallbackContext) -> bool:
     """Check if this is the first user message in the session."""
@@ -77,28 +93,68 @@ class LLMResponseCache:
     if not session or not session.events:
       return True
 
-    user_message_count = sum(
-        1 for event in session.events if event.author == "user"
-    )
-    return user_message_count == 0
+    # Stops at the first user event instead of counting all of them
+    return not any(event.author == "user" for event in session.events)
 
   def _build_cache_key(
       self, prompt: str, callback_context: CallbackContext
   ) -> str:
     """Build a cache key from the prompt and context."""
-    parts = []
     session = callback_context.session
+    if not session:
+      return self._format_cache_key(prompt)
+    return self._key_template.format(
+        app_name=session.app_name,
+        user_id=session.user_id,
+        session_id=session.id,
+        prompt=prompt,
+    )
 
-    if self._config.include_app_name and session:
-      parts.append(f"app:{session.app_name}")
-    if self._config.include_user_id and session:
-      parts.append(f"user:{session.user_id}")
-    if self._config.include_session_id and session:
-      parts.append(f"session:{session.id}")
+  def _format_cache_key(
+      self,
+      prompt: str,
+      app_name: Optional[str] = None,
+      user_id: Optional[str] = None,
+      session_id: Optional[str] = None,
+  ) -> str:
+    """Format a cache key from the prompt and optional scope values."""
+    parts = []
+
+    if self._config.include_app_name and app_name is not None:
+      parts.append(f"app:{app_name}")
+    if self._config.include_user_id and user_id is not None:
+      parts.append(f"user:{user_id}")
+    if self._config.include_session_id and session_id is not None:
+      parts.append(f"session:{session_id}")
 
     parts.append(prompt)
     return " | ".join(parts)
 
+  async def prewarm(
+      self,
+      prompts: list[str],
+      app_name: Optional[str] = None,
+      user_id: Optional[str] = None,
+      session_id: Optional[str] = None,
+  ) -> None:
+    """Precompute cache lookups for prompts that are about to be sent.
+
+    Cache keys are built exactly as the callbacks would build them for the
+    given scope, then handed to the provider in one batch so embedding runs
+    as a single vectorizer call instead of one per request.
+
+    Args:
+        prompts: User prompts expected in upcoming requests.
+        app_name: App name the requests will run under.
+        user_id: User ID the requests will run under.
+        session_id: Session ID, if session IDs are part of the key.
+    """
+    keys = [
+        self._format_cache_key(p, app_name, user_id, session_id)
+        for p in prompts
+    ]
+    await self._provider.prewarm(keys)
+
   def _extract_prompt(self, llm_request: LlmRequest) -> Optional[str]:
     """Extract the user prompt from the LLM request."""
     if not llm_request.contents:
@@ -108,7 +164,7 @@ class LLMResponseCache:
     for content in reversed(llm_request.contents):
       if content.role == "user" and content.parts:
         for part in content.parts:
-          if hasattr(part, "text") and part.text:
+          if part.text:
             return part.text
     return None
 
@@ -118,7 +174,7 @@ class LLMResponseCache:
       return None
 
     for part in llm_response.content.parts:
-      if hasattr(part, "text") and part.text:
+      if part.text:
         return part.text
     return None
 
@@ -136,6 +192,8 @@ class LLMResponseCache:
     Returns:
         LlmResponse if cache hit, None to proceed with LLM call.
     """
+    # Drop any key left by an earlier call that failed before storing
+    _pending_prompt.set(None)
     if self._config.first_message_only and not self._is_first_message(
         callback_context
     ):
@@ -148,7 +206,12 @@ class LLMResponseCache:
       return None
 
     cache_key = self._build_cache_key(prompt, callback_context)
-    cache_entry = await self._provider.check(cache_key)
+    try:
+      cache_entry = await self._provider.check(cache_key)
+    except Exception as e:
+      # A cache outage must not fail the turn; treat it as a miss
+      logger.warning("Cache check failed for %s: %s", prompt[:50], e)
+      return None
 
     if cache_entry:
       logger.info("Cache hit for prompt: %s", prompt[:50])
@@ -161,17 +224,9 @@ class LLMResponseCache:
 
     logger.debug("Cache miss for prompt: %s", prompt[:50])
     # Store prompt for after_model_callback
-    session_key = self._get_session_key(callback_context)
-    self._pending_prompts[session_key] = cache_key
+    _pending_prompt.set((callback_context.invocation_id, cache_key))
     return None
 
-  def _get_session_key(self, callback_context: CallbackContext) -> str:
-    """Get a unique key for the current session context."""
-    session = callback_context.session
-    if session:
-      return f"{session.app_name}:{session.user_id}:{session.id}"
-    return "default"
-
   async def after_model_callback(
       self,
       callback_context: CallbackContext,
@@ -186,8 +241,11 @@ class LLMResponseCache:
     Returns:
         None to pass through the original response.
     """
-    session_key = self._get_session_key(callback_context)
-    cache_key = self._pending_prompts.pop(session_key, None)
+    pending = _pending_prompt.get()
+    _pending_prompt.set(None)
+    cache_key = None
+    if pending and pending[0] == callback_context.invocation_id:
+      cache_key = pending[1]
 
     if not cache_key:
       logger.debug("No pending prompt for session, skipping cache store")
@@ -201,7 +259,7 @@ class LLMResponseCache:
     # Don't cache function call responses
     if llm_response.content and llm_response.content.parts:
       for part in llm_response.content.parts:
-        if hasattr(part, "function_call") and part.function_call:
+        if part.function_call:
           logger.debug("Response is function call, skipping cache store")
           return None
 
@@ -210,6 +268,10 @@ class LLMResponseCache:
       logger.debug("No text in response, skipping cache store")
       return None
 
-    await self._provider.store(cache_key, response_text)
+    try:
+      await self._provider.store(cache_key, response_text)
+    except Exception as e:
+      logger.warning("Cache store failed for %s: %s", cache_key[:50], e)
+      return None
     logger.info("Cached response for prompt: %s", cache_key[:50])
     return None
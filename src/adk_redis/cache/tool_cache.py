@@ -16,6 +16,10 @@
 
 from __future__ import annotations
 
+from contextvars import ContextVar
+import dataclasses
+import datetime
+import enum
 import json
 import logging
 from typing import Any, Dict, Optional, Set
@@ -29,6 +33,66 @@ from ._provider import BaseCacheProvider
 
 logger = logging.getLogger("google_adk." + __name__)
 
+# Cache key of the tool call in flight, with the ToolContext it belongs to.
+# ADK runs a tool's before and after callbacks in the same task, and
+# parallel tool calls each get their own task, so no shared map is needed.
+_pending_call: ContextVar[Optional[tuple[ToolContext, str]]] = ContextVar(
+    "adk_redis_pending_call", default=None
+)
+
+
+def _json_default(obj: Any) -> Any:
+  """Encode values json can't, the way orjson does natively."""
+  if isinstance(obj, (datetime.date, datetime.time)):
+    return obj.isoformat()
+  if isinstance(obj, enum.Enum):
+    return obj.value
+  if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+    return dataclasses.asdict(obj)
+  return str(obj)
+
+
+def _json_dumps(obj: Any) -> str:
+  return json.dumps(obj, default=_json_default, separators=(",", ":"))
+
+
+# orjson is optional; it serializes tool results faster than json, and the
+# stdlib path above writes the same values, so a cached response reads back
+# alike either way. The one difference: orjson writes NaN and Infinity as
+# null. Cache keys always use json (see _key_dumps).
+try:
+  import orjson
+
+  def _dumps(obj: Any) -> str:
+    try:
+      return orjson.dumps(
+          obj, default=str, option=orjson.OPT_NON_STR_KEYS
+      ).decode()
+    except TypeError:
+      # orjson rejects ints beyond 64 bits; json writes them as numbers
+      return _json_dumps(obj)
+
+except ImportError:
+  _dumps = _json_dumps
+
+
+def _str_keys(obj: Any) -> Any:
+  """Return obj with every dict key converted to str, recursively."""
+  if isinstance(obj, dict):
+    return {str(k): _str_keys(v) for k, v in obj.items()}
+  if isinstance(obj, (list, tuple)):
+    return [_str_keys(v) for v in obj]
+  return obj
+
+
+def _key_dumps(args: Dict[str, Any]) -> str:
+  """Serialize tool args canonically for use in a cache key."""
+  try:
+    return json.dumps(args, sort_keys=True, default=str)
+  except TypeError:
+    # Keys of mixed types can't be sorted; compare them as strings
+    return json.dumps(_str_keys(args), sort_keys=True, default=str)
+
 
 class ToolCacheConfig(BaseModel):
   """Configuration for tool result caching.
@@ -67,8 +131,6 @@ class ToolCache:
     """
     self._provider = provider
     self._config = config or ToolCacheConfig()
-    # Track pending tool calls by session key for after_tool_callback
-    self._pending_calls: dict[str, str] = {}
 
   def _should_cache_tool(self, tool_name: str) -> bool:
     """Check if the tool should be cached."""
@@ -89,18 +151,13 @@ class ToolCache:
     # Just use tool name and args for cache key
     parts.append(f"tool:{tool_name}")
     try:
-      args_str = json.dumps(args, sort_keys=True, default=str)
+      args_str = _key_dumps(args)
     except (TypeError, ValueError):
       args_str = str(args)
     parts.append(f"args:{args_str}")
 
     return " | ".join(parts)
 
-  def _get_session_key(self, tool_context: ToolContext) -> str:
-    """Get a unique key for the current session context."""
-    # Use tool_context id as session key
-    return str(id(tool_context))
-
   async def before_tool_callback(
       self,
       tool: BaseTool,
@@ -117,13 +174,20 @@ class ToolCache:
     Returns:
         Dict if cache hit (skips tool execution), None to proceed.
     """
+    # Drop any key left by an earlier call that failed before storing
+    _pending_call.set(None)
     tool_name = tool.name
     if not self._should_cache_tool(tool_name):
       logger.debug("Tool %s not in cache list, skipping", tool_name)
       return None
 
     cache_key = self._build_cache_key(tool_name, args, tool_context)
-    cache_entry = await self._provider.check(cache_key)
+    try:
+      cache_entry = await self._provider.check(cache_key)
+    except Exception as e:
+      # A cache outage must not fail the turn; treat it as a miss
+      logger.warning("Cache check failed for %s: %s", tool_name, e)
+      return None
 
     if cache_entry:
       logger.info("Cache hit for tool: %s", tool_name)
@@ -134,8 +198,7 @@ class ToolCache:
 
     logger.debug("Cache miss for tool: %s", tool_name)
     # Store cache key for after_tool_callback
-    session_key = self._get_session_key(tool_context)
-    self._pending_calls[session_key] = cache_key
+    _pending_call.set((tool_context, cache_key))
     return None
 
   async def after_tool_callback(
@@ -156,8 +219,11 @@ class ToolCache:
     Returns:
         None to pass through the original response.
     """
-    session_key = self._get_session_key(tool_context)
-    cache_key = self._pending_calls.pop(session_key, None)
+    pending = _pending_call.get()
+    _pending_call.set(None)
+    cache_key = None
+    if pending and pending[0] is tool_context:
+      cache_key = pending[1]
 
     if not cache_key:
       logger.debug("No pending cache key for tool, skipping store")
@@ -165,10 +231,14 @@ class ToolCache:
 
     # Serialize the tool response
     try:
-      response_str = json.dumps(tool_response, default=str)
+      response_str = _dumps(tool_response)
     except (TypeError, ValueError):
       response_str = str(tool_response)
 
-    await self._provider.store(cache_key, response_str)
+    try:
+      await self._provider.store(cache_key, response_str)
+    except Exception as e:
+      logger.warning("Cache store failed for %s: %s", tool.name, e)
+      return None
     logger.info("Cached result for tool: %s", tool.name)
     return None
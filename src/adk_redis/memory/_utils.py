@@ -16,11 +16,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from collections.abc import Callable
+from collections.abc import Hashable
+import logging
+from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
   from google.adk.events.event import Event
 
+logger = logging.getLogger("adk_redis." + __name__)
+
 
 def extract_text_from_event(event: "Event") -> str:
   """Extracts text content from an event's content parts.
@@ -45,3 +51,67 @@ def extract_text_from_event(event: "Event") -> str:
       if part.text and not part.thought
   ]
   return " ".join(text_parts)
+
+
+class LoopClients:
+  """Async clients kept per running event loop.
+
+  An async HTTP client only works on the loop that created it, and the ADK
+  Runner creates a new loop for each run() call, so clients are reused only
+  within their own loop. Entries are keyed by id(loop) but hold the loop
+  itself, so a recycled id is never mistaken for a live loop. Entries for
+  loops that have closed are dropped on the next access, which releases
+  their connections.
+  """
+
+  def __init__(self) -> None:
+    self._loops: dict[
+        int, tuple[asyncio.AbstractEventLoop, dict[Hashable, Any]]
+    ] = {}
+
+  def get(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the running loop's client for key, creating it if needed.
+
+    Outside a running loop a fresh, unshared client is returned.
+    """
+    try:
+      loop = asyncio.get_running_loop()
+    except RuntimeError:
+      return factory()
+    self._drop_closed()
+    entry = self._loops.get(id(loop))
+    if entry is None or entry[0] is not loop:
+      entry = self._loops[id(loop)] = (loop, {})
+    clients = entry[1]
+    client = clients.get(key)
+    if client is None:
+      client = clients[key] = factory()
+    return client
+
+  async def aclose(self) -> None:
+    """Close the clients of the running loop and of loops still running.
+
+    Clients of an open loop that is not running are kept, so a later
+    aclose() on that loop closes them. A closed loop's connections cannot
+    be shut down from here; they are released once its clients are
+    dropped.
+    """
+    running = asyncio.get_running_loop()
+    for loop_id, (loop, clients) in list(self._loops.items()):
+      if not loop.is_closed():
+        if loop is not running and not loop.is_running():
+          continue
+        for client in clients.values():
+          try:
+            if loop is running:
+              await client.close()
+            else:
+              asyncio.run_coroutine_threadsafe(client.close(), loop)
+          except Exception as e:
+            logger.debug("Failed to close memory client: %s", e)
+      del self._loops[loop_id]
+
+  def _drop_closed(self) -> None:
+    closed = [i for i, (loop, _) in self._loops.items() if loop.is_closed()]
+    for loop_id in closed:
+      del self._loops[loop_id]
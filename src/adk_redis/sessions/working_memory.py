@@ -37,6 +37,7 @@ from pydantic import Field
 from typing_extensions import override
 
 from adk_redis.memory._utils import extract_text_from_event
+from adk_redis.memory._utils import LoopClients
 
 logger = logging.getLogger("adk_redis." + __name__)
 
@@ -109,13 +110,16 @@ class RedisWorkingMemorySessionService(BaseSessionService):
         config: Configuration for the service. If None, uses defaults.
     """
     self._config = config or RedisWorkingMemorySessionServiceConfig()
+    # One client per event loop
+    self._clients = LoopClients()
 
   def _get_client(self) -> Any:
     """Get a MemoryAPIClient instance.
 
-    Note: We create a new client for each call instead of caching it because
-    the ADK Runner creates a new event loop for each run() call, and cached
-    async clients get tied to the first event loop and fail when it closes.
+    The client is reused within the running event loop so session calls
+    share its pooled keep-alive connections. It is not cached across loops
+    because the ADK Runner creates a new event loop for each run() call, and
+    async clients tied to a closed loop fail.
     """
     try:
       from agent_memory_client import MemoryAPIClient
@@ -127,14 +131,17 @@ class RedisWorkingMemorySessionService(BaseSessionService):
           "Install it with: pip install adk-redis[memory]"
       ) from e
 
-    client_config = MemoryClientConfig(
-        base_url=self._config.api_base_url,
-        timeout=self._config.timeout,
-        default_namespace=self._config.default_namespace,
-        default_model_name=self._config.model_name,
-        default_context_window_max=self._config.context_window_max,
-    )
-    return MemoryAPIClient(client_config)
+    def create() -> Any:
+      client_config = MemoryClientConfig(
+          base_url=self._config.api_base_url,
+          timeout=self._config.timeout,
+          default_namespace=self._config.default_namespace,
+          default_model_name=self._config.model_name,
+          default_context_window_max=self._config.context_window_max,
+      )
+      return MemoryAPIClient(client_config)
+
+    return self._clients.get(None, create)
 
   def _get_namespace(self, app_name: str) -> str:
     """Get namespace from config or app_name."""
@@ -448,5 +455,4 @@ class RedisWorkingMemorySessionService(BaseSessionService):
 
   async def close(self) -> None:
     """Close the session service and cleanup resources."""
-    # No longer caching client, so nothing to close
-    pass
+    await self._clients.aclose()
@@ -24,6 +24,7 @@ from adk_redis.tools.search import BaseRedisSearchTool
 from adk_redis.tools.search import RedisAggregatedHybridQueryConfig
 from adk_redis.tools.search import RedisHybridQueryConfig
 from adk_redis.tools.search import RedisHybridSearchTool
+from adk_redis.tools.search import RedisMultiSearchTool
 from adk_redis.tools.search import RedisRangeQueryConfig
 from adk_redis.tools.search import RedisRangeSearchTool
 from adk_redis.tools.search import RedisTextQueryConfig
@@ -39,6 +40,7 @@ __all__ = [
     # Search tools
     "RedisVectorSearchTool",
     "RedisHybridSearchTool",
+    "RedisMultiSearchTool",
     "RedisRangeSearchTool",
     "RedisTextSearchTool",
     # Memory tools
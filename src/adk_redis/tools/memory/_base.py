@@ -21,10 +21,16 @@ from typing import Any
 
 from google.adk.tools.base_tool import BaseTool
 
+from adk_redis.memory._utils import LoopClients
 from adk_redis.tools.memory._config import MemoryToolConfig
 
 logger = logging.getLogger("adk_redis." + __name__)
 
+# MemoryAPIClient instances shared by all memory tools, per event loop and
+# per connection settings, so tool calls reuse pooled keep-alive connections
+# instead of opening a new HTTP client each time.
+_shared_clients = LoopClients()
+
 
 class BaseMemoryTool(BaseTool):
   """Base class for all Redis Agent Memory tools.
@@ -61,9 +67,10 @@ class BaseMemoryTool(BaseTool):
   def _get_client(self) -> Any:
     """Get a MemoryAPIClient instance.
 
-    Note: We create a new client for each call instead of caching it because
-    the ADK Runner creates a new event loop for each run() call, and cached
-    async clients get tied to the first event loop and fail when it closes.
+    Clients are shared per running event loop: the ADK Runner creates a new
+    event loop for each run() call, and an async client tied to a closed loop
+    fails, so a client is only reused within the loop that created it. All
+    memory tools with the same connection settings share one client.
 
     Returns:
         An initialized MemoryAPIClient instance.
@@ -80,12 +87,21 @@ class BaseMemoryTool(BaseTool):
           "Install it with: pip install adk-redis[memory]"
       ) from e
 
-    client_config = MemoryClientConfig(
-        base_url=self._config.api_base_url,
-        timeout=self._config.timeout,
-        default_namespace=self._config.default_namespace,
+    key = (
+        self._config.api_base_url,
+        self._config.timeout,
+        self._config.default_namespace,
     )
-    return MemoryAPIClient(client_config)
+
+    def create() -> Any:
+      client_config = MemoryClientConfig(
+          base_url=self._config.api_base_url,
+          timeout=self._config.timeout,
+          default_namespace=self._config.default_namespace,
+      )
+      return MemoryAPIClient(client_config)
+
+    return _shared_clients.get(key, create)
 
   def _build_recency_config(self) -> Any:
     """Build RecencyConfig from tool configuration.
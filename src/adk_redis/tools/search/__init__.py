@@ -22,6 +22,7 @@ from adk_redis.tools.search._config import RedisRangeQueryConfig
 from adk_redis.tools.search._config import RedisTextQueryConfig
 from adk_redis.tools.search._config import RedisVectorQueryConfig
 from adk_redis.tools.search.hybrid import RedisHybridSearchTool
+from adk_redis.tools.search.multi import RedisMultiSearchTool
 from adk_redis.tools.search.range import RedisRangeSearchTool
 from adk_redis.tools.search.text import RedisTextSearchTool
 from adk_redis.tools.search.vector import RedisVectorSearchTool
@@ -33,6 +34,7 @@ __all__ = [
     # Search tools
     "RedisVectorSearchTool",
     "RedisHybridSearchTool",
+    "RedisMultiSearchTool",
     "RedisRangeSearchTool",
     "RedisTextSearchTool",
     # Config classes
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable
 from collections.abc import Coroutine
 from typing import Any
@@ -29,6 +30,37 @@ from redisvl.index import AsyncSearchIndex
 from redisvl.index import SearchIndex
 from redisvl.utils.vectorize import BaseVectorizer
 
+# Default number of distinct query embeddings kept per tool.
+DEFAULT_EMBEDDING_CACHE_SIZE = 128
+
+
+class _QueryEmbeddingCache:
+  """Bounded LRU cache of query text to embedding.
+
+  Agents often repeat the same search query within a conversation; caching
+  skips re-running the embedding model. Each tool has its own cache, so a
+  query repeated across different search tools is embedded once per tool.
+  """
+
+  def __init__(self, vectorizer: BaseVectorizer, maxsize: int):
+    self._vectorizer = vectorizer
+    self._maxsize = maxsize
+    self._entries: OrderedDict[str, list[float]] = OrderedDict()
+
+  async def aembed(self, text: str) -> list[float]:
+    """Return the embedding for text, computing it on a cache miss."""
+    cached = self._entries.get(text)
+    if cached is not None:
+      self._entries.move_to_end(text)
+      return cached
+
+    embedding: list[float] = await self._vectorizer.aembed(text)
+    if self._maxsize > 0:
+      self._entries[text] = embedding
+      if len(self._entries) > self._maxsize:
+        self._entries.popitem(last=False)
+    return embedding
+
 
 class BaseRedisSearchTool(BaseTool):
   """Base class for ALL Redis search tools using RedisVL.
@@ -165,6 +197,7 @@ class VectorizedSearchTool(BaseRedisSearchTool):
       index: SearchIndex | AsyncSearchIndex,
       vectorizer: BaseVectorizer,
       return_fields: list[str] | None = None,
+      embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
   ):
     """Initialize the vectorized search tool.
 
@@ -174,6 +207,8 @@ class VectorizedSearchTool(BaseRedisSearchTool):
         index: The RedisVL SearchIndex or AsyncSearchIndex to query.
         vectorizer: The vectorizer for embedding queries (required).
         return_fields: Optional list of fields to return in results.
+        embedding_cache_size: Number of recent query embeddings to keep in
+            memory. Set to 0 to disable caching.
     """
     super().__init__(
         name=name,
@@ -182,6 +217,9 @@ class VectorizedSearchTool(BaseRedisSearchTool):
         return_fields=return_fields,
     )
     self._vectorizer = vectorizer
+    self._embedding_cache = _QueryEmbeddingCache(
+        vectorizer, embedding_cache_size
+    )
 
   @abstractmethod
   def _build_query(
@@ -213,7 +251,7 @@ class VectorizedSearchTool(BaseRedisSearchTool):
     """
 
     async def build_query_fn(query_text: str, args: dict[str, Any]) -> Any:
-      embedding = await self._vectorizer.aembed(query_text)
+      embedding = await self._embedding_cache.aembed(query_text)
       return self._build_query(query_text, embedding, **args)
 
     return await self._run_search(args, build_query_fn)
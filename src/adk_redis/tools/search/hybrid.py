@@ -26,6 +26,7 @@ from redisvl.index import AsyncSearchIndex
 from redisvl.index import SearchIndex
 from redisvl.utils.vectorize import BaseVectorizer
 
+from adk_redis.tools.search._base import DEFAULT_EMBEDDING_CACHE_SIZE
 from adk_redis.tools.search._base import VectorizedSearchTool
 from adk_redis.tools.search._config import RedisAggregatedHybridQueryConfig
 from adk_redis.tools.search._config import RedisHybridQueryConfig
@@ -214,6 +215,7 @@ class RedisHybridSearchTool(VectorizedSearchTool):
       ) = None,
       return_fields: list[str] | None = None,
       filter_expression: Any | None = None,
+      embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
       name: str = "redis_hybrid_search",
       description: str = "Search using both semantic similarity and keyword matching.",
   ):
@@ -228,6 +230,8 @@ class RedisHybridSearchTool(VectorizedSearchTool):
             If None, auto-detects based on installed RedisVL version.
         return_fields: Optional list of fields to return in results.
         filter_expression: Optional filter expression to narrow results.
+        embedding_cache_size: Number of recent query embeddings to keep in
+            memory. Set to 0 to disable caching.
         name: The name of the tool (exposed to LLM).
         description: The description of the tool (exposed to LLM).
 
@@ -244,6 +248,7 @@ class RedisHybridSearchTool(VectorizedSearchTool):
         index=index,
         vectorizer=vectorizer,
         return_fields=return_fields,
+        embedding_cache_size=embedding_cache_size,
     )
 
     self._supports_native = _supports_native_hybrid(index)
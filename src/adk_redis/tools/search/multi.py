@@ -0,0 +1,215 @@
+# Copyright 2025 Redis, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Redis multi-search tool running vector, text, and range search at once."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from google.adk.tools.tool_context import ToolContext
+from redisvl.index import AsyncSearchIndex
+from redisvl.index import SearchIndex
+from redisvl.query import TextQuery
+from redisvl.query import VectorQuery
+from redisvl.query import VectorRangeQuery
+from redisvl.utils.vectorize import BaseVectorizer
+
+from adk_redis.tools.search._base import _QueryEmbeddingCache
+from adk_redis.tools.search._base import BaseRedisSearchTool
+from adk_redis.tools.search._base import DEFAULT_EMBEDDING_CACHE_SIZE
+from adk_redis.tools.search._config import RedisRangeQueryConfig
+from adk_redis.tools.search._config import RedisTextQueryConfig
+from adk_redis.tools.search._config import RedisVectorQueryConfig
+
+
+class RedisMultiSearchTool(BaseRedisSearchTool):
+  """Vector, keyword, and range search in a single Redis round trip.
+
+  This tool embeds the query once and sends a KNN vector query, a BM25
+  text query, and a vector range query to Redis together in one pipeline
+  (via RedisVL's ``batch_query``). Use it alongside the individual search
+  tools when an agent would otherwise call several of them for the same
+  question.
+
+  Example:
+      ```python
+      from redisvl.index import SearchIndex
+      from redisvl.utils.vectorize import HFTextVectorizer
+      from adk_redis import (
+          RedisMultiSearchTool,
+          RedisRangeQueryConfig,
+          RedisTextQueryConfig,
+          RedisVectorQueryConfig,
+      )
+
+      index = SearchIndex.from_yaml("schema.yaml")
+      vectorizer = HFTextVectorizer(model="redis/langcache-embed-v2")
+
+      tool = RedisMultiSearchTool(
+          index=index,
+          vectorizer=vectorizer,
+          vector_config=RedisVectorQueryConfig(num_results=5),
+          text_config=RedisTextQueryConfig(text_field_name="content"),
+          range_config=RedisRangeQueryConfig(distance_threshold=0.5),
+          return_fields=["title", "content"],
+      )
+
+      agent = Agent(model="gemini-2.5-flash", tools=[tool])
+      ```
+  """
+
+  def __init__(
+      self,
+      *,
+      index: SearchIndex | AsyncSearchIndex,
+      vectorizer: BaseVectorizer,
+      vector_config: RedisVectorQueryConfig | None = None,
+      text_config: RedisTextQueryConfig | None = None,
+      range_config: RedisRangeQueryConfig | None = None,
+      return_fields: list[str] | None = None,
+      filter_expression: Any | None = None,
+      embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+      name: str = "redis_multi_search",
+      description: str = (
+          "Run semantic, keyword, and range search for a query in one call."
+      ),
+  ):
+    """Initialize the multi-search tool.
+
+    Args:
+        index: The RedisVL SearchIndex or AsyncSearchIndex to query.
+        vectorizer: The vectorizer for embedding queries.
+        vector_config: Configuration for the KNN vector query. If None,
+            uses defaults.
+        text_config: Configuration for the BM25 text query. If None, uses
+            defaults.
+        range_config: Configuration for the vector range query. If None,
+            uses defaults.
+        return_fields: Optional list of fields to return in results.
+        filter_expression: Optional filter expression applied to all three
+            queries.
+        embedding_cache_size: Number of recent query embeddings to keep in
+            memory. Set to 0 to disable caching.
+        name: The name of the tool (exposed to LLM).
+        description: The description of the tool (exposed to LLM).
+    """
+    super().__init__(
+        name=name,
+        description=description,
+        index=index,
+        return_fields=return_fields,
+    )
+    self._vectorizer = vectorizer
+    self._embedding_cache = _QueryEmbeddingCache(
+        vectorizer, embedding_cache_size
+    )
+    self._vector_config = vector_config or RedisVectorQueryConfig()
+    self._text_config = text_config or RedisTextQueryConfig()
+    self._range_config = range_config or RedisRangeQueryConfig()
+    self._filter_expression = filter_expression
+
+  def _build_queries(
+      self, query_text: str, embedding: list[float]
+  ) -> list[Any]:
+    """Build the vector, text, and range queries for one search.
+
+    Args:
+        query_text: The original query text from the user.
+        embedding: The vector embedding of the query text, shared by the
+            vector and range queries.
+
+    Returns:
+        A list of [VectorQuery, TextQuery, VectorRangeQuery].
+    """
+    vector_kwargs = self._vector_config.to_query_kwargs(
+        vector=embedding,
+        filter_expression=self._filter_expression,
+    )
+    vector_kwargs["return_fields"] = self._return_fields
+
+    text_kwargs = self._text_config.to_query_kwargs(
+        text=query_text,
+        return_fields=self._return_fields,
+        filter_expression=self._filter_expression,
+    )
+
+    range_kwargs = self._range_config.to_query_kwargs(
+        vector=embedding,
+        filter_expression=self._filter_expression,
+    )
+    range_kwargs["return_fields"] = self._return_fields
+
+    return [
+        VectorQuery(**vector_kwargs),
+        TextQuery(**text_kwargs),
+        VectorRangeQuery(**range_kwargs),
+    ]
+
+  async def _execute_queries(
+      self, queries: list[Any]
+  ) -> list[list[dict[str, Any]]]:
+    """Execute several RedisVL queries in one pipelined round trip.
+
+    Args:
+        queries: RedisVL query objects to run together.
+
+    Returns:
+        One list of result dictionaries per query, in the same order.
+    """
+    if self._is_async_index:
+      batches = await self._index.batch_query(queries, batch_size=len(queries))
+    else:
+      # Run sync pipeline in thread pool to avoid blocking
+      batches = await asyncio.to_thread(
+          self._index.batch_query, queries, batch_size=len(queries)
+      )
+
+    return [
+        [dict(r) for r in results] if results else [] for results in batches
+    ]
+
+  async def run_async(
+      self, *, args: dict[str, Any], tool_context: ToolContext
+  ) -> dict[str, Any]:
+    """Execute all three searches for the query.
+
+    Args:
+        args: Arguments from the LLM, must include 'query'.
+        tool_context: The tool execution context.
+
+    Returns:
+        A dictionary with status and one {count, results} entry per search
+        type under 'semantic', 'keyword', and 'range'.
+    """
+    query_text = args.get("query", "")
+
+    if not query_text:
+      return {"status": "error", "error": "Query text is required."}
+
+    try:
+      embedding = await self._embedding_cache.aembed(query_text)
+      queries = self._build_queries(query_text, embedding)
+      semantic, keyword, in_range = await self._execute_queries(queries)
+
+      return {
+          "status": "success",
+          "semantic": {"count": len(semantic), "results": semantic},
+          "keyword": {"count": len(keyword), "results": keyword},
+          "range": {"count": len(in_range), "results": in_range},
+      }
+
+    except Exception as e:
+      return {"status": "error", "error": str(e)}
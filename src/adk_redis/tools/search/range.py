@@ -24,6 +24,7 @@ from redisvl.index import SearchIndex
 from redisvl.query import VectorRangeQuery
 from redisvl.utils.vectorize import BaseVectorizer
 
+from adk_redis.tools.search._base import DEFAULT_EMBEDDING_CACHE_SIZE
 from adk_redis.tools.search._base import VectorizedSearchTool
 from adk_redis.tools.search._config import RedisRangeQueryConfig
 
@@ -71,6 +72,7 @@ class RedisRangeSearchTool(VectorizedSearchTool):
       config: RedisRangeQueryConfig | None = None,
       return_fields: list[str] | None = None,
       filter_expression: Any | None = None,
+      embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
       name: str = "redis_range_search",
       description: str = "Find all documents within a similarity threshold.",
   ):
@@ -84,6 +86,8 @@ class RedisRangeSearchTool(VectorizedSearchTool):
             distance_threshold, vector_field_name, and epsilon.
         return_fields: Optional list of fields to return in results.
         filter_expression: Optional filter expression to narrow results.
+        embedding_cache_size: Number of recent query embeddings to keep in
+            memory. Set to 0 to disable caching.
         name: The name of the tool (exposed to LLM).
         description: The description of the tool (exposed to LLM).
     """
@@ -93,6 +97,7 @@ class RedisRangeSearchTool(VectorizedSearchTool):
         index=index,
         vectorizer=vectorizer,
         return_fields=return_fields,
+        embedding_cache_size=embedding_cache_size,
     )
     self._config = config or RedisRangeQueryConfig()
     self._filter_expression = filter_expression
@@ -24,6 +24,7 @@ from redisvl.index import SearchIndex
 from redisvl.query import VectorQuery
 from redisvl.utils.vectorize import BaseVectorizer
 
+from adk_redis.tools.search._base import DEFAULT_EMBEDDING_CACHE_SIZE
 from adk_redis.tools.search._base import VectorizedSearchTool
 from adk_redis.tools.search._config import RedisVectorQueryConfig
 
@@ -74,6 +75,7 @@ class RedisVectorSearchTool(VectorizedSearchTool):
       config: RedisVectorQueryConfig | None = None,
       return_fields: list[str] | None = None,
       filter_expression: Any | None = None,
+      embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
       name: str = "redis_vector_search",
       description: str = "Search for semantically similar documents using vector similarity with Redis.",
   ):
@@ -88,6 +90,8 @@ class RedisVectorSearchTool(VectorizedSearchTool):
             parameters like ef_runtime and hybrid_policy.
         return_fields: Optional list of fields to return in results.
         filter_expression: Optional RedisVL FilterExpression to narrow results.
+        embedding_cache_size: Number of recent query embeddings to keep in
+            memory. Set to 0 to disable caching.
         name: The name of the tool (exposed to LLM).
         description: The description of the tool (exposed to LLM).
     """
@@ -97,6 +101,7 @@ class RedisVectorSearchTool(VectorizedSearchTool):
         index=index,
         vectorizer=vectorizer,
         return_fields=return_fields,
+        embedding_cache_size=embedding_cache_size,
     )
     self._config = config or RedisVectorQueryConfig()
     self._filter_expression = filter_expression
@@ -0,0 +1,3 @@
+# Copyright 2025 Redis, Inc.
+# Licensed under the Apache License, Version 2.0
+"""Semantic cache tests."""
@@ -0,0 +1,447 @@
+# Copyright 2025 Redis, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for RedisVLCacheProvider and LLMResponseCache."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+import pytest
+
+# Skip all tests if redisvl is not installed
+pytest.importorskip("redisvl")
+
+from adk_redis.cache import LLMResponseCache
+from adk_redis.cache import LLMResponseCacheConfig
+from adk_redis.cache import RedisVLCacheProvider
+from adk_redis.cache import RedisVLCacheProviderConfig
+
+
+@pytest.fixture
+def mock_semantic_cache():
+  """Mock RedisVL SemanticCache so no Redis connection is made."""
+  with patch("redisvl.extensions.llmcache.SemanticCache") as cls:
+    cache = MagicMock()
+    cache.acheck = AsyncMock(return_value=[])
+    cache.astore = AsyncMock(return_value="key")
+    cache.aclear = AsyncMock()
+    cache.adisconnect = AsyncMock()
+    cls.return_value = cache
+    yield cache
+
+
+async def _aiter(items):
+  for item in items:
+    yield item
+
+
+@pytest.fixture(autouse=True)
+def mock_async_redis(mock_semantic_cache):
+  """Mock the async Redis client SemanticCache hands out."""
+  client = MagicMock()
+  client.get = AsyncMock(return_value=None)
+  client.set = AsyncMock()
+  pipe = MagicMock()
+  pipe.execute = AsyncMock()
+  client.pipeline = MagicMock(return_value=pipe)
+  client.scan_iter = MagicMock(side_effect=lambda **kwargs: _aiter([]))
+  client.delete = AsyncMock()
+  mock_semantic_cache._get_async_redis_client = AsyncMock(return_value=client)
+  return client
+
+
+@pytest.fixture
+def provider(mock_semantic_cache, mock_vectorizer):
+  """Create RedisVLCacheProvider instance for testing."""
+  mock_vectorizer.embed_many = MagicMock(
+      side_effect=lambda texts, **kwargs: [[float(len(t))] for t in texts]
+  )
+  mock_vectorizer.embed = MagicMock(
+      side_effect=lambda text, **kwargs: [float(len(text))]
+  )
+  return RedisVLCacheProvider(
+      config=RedisVLCacheProviderConfig(), vectorizer=mock_vectorizer
+  )
+
+
+class TestRedisVLCacheProviderPrewarm:
+  """Tests for batched prompt prewarming."""
+
+  async def test_prewarm_embeds_in_one_batch(self, provider, mock_vectorizer):
+    """Test that prewarm makes a single embed_many call for unique prompts."""
+    await provider.prewarm(["a", "bb", "a"])
+
+    mock_vectorizer.embed_many.assert_called_once()
+    assert mock_vectorizer.embed_many.call_args.args[0] == ["a", "bb"]
+
+  async def test_prewarm_skips_known_prompts(self, provider, mock_vectorizer):
+    """Test that already-prewarmed prompts are not embedded again."""
+    await provider.prewarm(["a"])
+    await provider.prewarm(["a"])
+
+    mock_vectorizer.embed_many.assert_called_once()
+
+  async def test_check_and_store_reuse_prewarmed_vector(
+      self, provider, mock_semantic_cache
+  ):
+    """Test that check and store pass the prewarmed vector through."""
+    await provider.prewarm(["abc"])
+
+    await provider.check("abc")
+    await provider.store("abc", "response")
+
+    assert mock_semantic_cache.acheck.call_args.kwargs["vector"] == [3.0]
+    assert mock_semantic_cache.astore.call_args.kwargs["vector"] == [3.0]
+
+  async def test_check_without_prewarm(self, provider, mock_semantic_cache):
+    """Test that unknown prompts are embedded once for check and store."""
+    await provider.check("abc")
+    await provider.store("abc", "response")
+    await provider.check("abc")
+
+    provider._vectorizer.embed.assert_called_once_with("abc")
+    assert mock_semantic_cache.acheck.call_args.kwargs["vector"] == [3.0]
+    assert mock_semantic_cache.astore.call_args.kwargs["vector"] == [3.0]
+
+  async def test_embedding_cache_is_bounded(
+      self, mock_semantic_cache, mock_vectorizer
+  ):
+    """Test that the least recently used embedding is evicted."""
+    mock_vectorizer.embed = MagicMock(side_effect=lambda text: [1.0])
+    provider = RedisVLCacheProvider(
+        config=RedisVLCacheProviderConfig(embedding_cache_size=2),
+        vectorizer=mock_vectorizer,
+    )
+    for prompt in ("a", "b", "a", "c", "b"):
+      await provider.check(prompt)
+
+    embedded = [c.args[0] for c in mock_vectorizer.embed.call_args_list]
+    assert embedded == ["a", "b", "c", "b"]
+
+  async def test_embedding_cache_disabled(
+      self, mock_semantic_cache, mock_vectorizer
+  ):
+    """Test that with caching off, SemanticCache embeds the prompt."""
+    provider = RedisVLCacheProvider(
+        config=RedisVLCacheProviderConfig(embedding_cache_size=0),
+        vectorizer=mock_vectorizer,
+    )
+    await provider.check("abc")
+
+    assert mock_semantic_cache.acheck.call_args.kwargs["vector"] is None
+
+  async def test_close_disconnects_async(self, provider, mock_semantic_cache):
+    """Test that close awaits SemanticCache's async disconnect."""
+    await provider.close()
+
+    mock_semantic_cache.adisconnect.assert_awaited_once()
+
+  def test_new_event_loop_drops_async_client(
+      self, provider, mock_semantic_cache
+  ):
+    """Test that a client made on a finished loop is not reused."""
+    asyncio.run(provider.check("abc"))
+    mock_semantic_cache._aindex = "stale"
+    mock_semantic_cache._async_redis_client = "stale"
+
+    asyncio.run(provider.check("abc"))
+
+    assert mock_semantic_cache._aindex is None
+    assert mock_semantic_cache._async_redis_client is None
+
+
+@pytest.fixture
+def exact_provider(provider, mock_vectorizer):
+  """Create RedisVLCacheProvider with exact-match keys enabled."""
+  return RedisVLCacheProvider(
+      config=RedisVLCacheProviderConfig(exact_match=True),
+      vectorizer=mock_vectorizer,
+  )
+
+
+class TestRedisVLCacheProviderExactMatch:
+  """Tests for the exact-prompt fast path."""
+
+  async def test_exact_hit_skips_embedding(
+      self,
+      exact_provider,
+      mock_semantic_cache,
+      mock_vectorizer,
+      mock_async_redis,
+  ):
+    """Test that an exact key hit returns without embedding the prompt."""
+    mock_async_redis.get.return_value = "cached"
+
+    entry = await exact_provider.check("abc")
+
+    assert entry.response == "cached"
+    assert entry.distance == 0.0
+    mock_vectorizer.embed.assert_not_called()
+    mock_semantic_cache.acheck.assert_not_called()
+
+  async def test_store_writes_exact_key(self, exact_provider, mock_async_redis):
+    """Test that store sets the exact key with the cache TTL."""
+    await exact_provider.store("abc", "response")
+
+    key = mock_async_redis.set.call_args.args[0]
+    digest = exact_provider._vector_key("abc").hex()
+    assert key == f"adk_semantic_cache:exact:{digest}"
+    assert mock_async_redis.set.call_args.args[1] == "response"
+    assert mock_async_redis.set.call_args.kwargs["ex"] == 3600
+
+  async def test_exact_match_disabled(
+      self, mock_semantic_cache, mock_vectorizer, mock_async_redis
+  ):
+    """Test that by default only the semantic cache is used."""
+    provider = RedisVLCacheProvider(
+        config=RedisVLCacheProviderConfig(), vectorizer=mock_vectorizer
+    )
+    await provider.check("abc")
+    await provider.store("abc", "response")
+
+    mock_async_redis.get.assert_not_called()
+    mock_async_redis.set.assert_not_called()
+    mock_semantic_cache.acheck.assert_awaited_once()
+
+  async def test_store_many_batches_writes(
+      self,
+      exact_provider,
+      mock_semantic_cache,
+      mock_vectorizer,
+      mock_async_redis,
+  ):
+    """Test that store_many embeds once and pipelines the exact keys."""
+    await exact_provider.store_many([("a", "1"), ("bb", "2")])
+
+    mock_vectorizer.embed_many.assert_called_once()
+    mock_vectorizer.embed.assert_not_called()
+    assert mock_semantic_cache.astore.await_count == 2
+    pipe = mock_async_redis.pipeline.return_value
+    assert pipe.set.call_count == 2
+    pipe.execute.assert_awaited_once()
+    mock_async_redis.set.assert_not_called()
+
+  async def test_clear_deletes_exact_keys(
+      self, exact_provider, mock_semantic_cache, mock_async_redis
+  ):
+    """Test that a stored exact entry is a miss after clear."""
+    store = {}
+
+    async def fake_set(key, value, **kwargs):
+      store[key] = value
+
+    async def fake_delete(*keys):
+      for key in keys:
+        store.pop(key, None)
+
+    def fake_scan_iter(match, **kwargs):
+      prefix = match.rstrip("*")
+      return _aiter([k for k in list(store) if k.startswith(prefix)])
+
+    mock_async_redis.set = AsyncMock(side_effect=fake_set)
+    mock_async_redis.get = AsyncMock(side_effect=lambda key: store.get(key))
+    mock_async_redis.delete = AsyncMock(side_effect=fake_delete)
+    mock_async_redis.scan_iter = MagicMock(side_effect=fake_scan_iter)
+    await exact_provider.store("abc", "response")
+    assert (await exact_provider.check("abc")).response == "response"
+
+    await exact_provider.clear()
+
+    assert await exact_provider.check("abc") is None
+    mock_semantic_cache.aclear.assert_awaited_once()
+
+
+class TestLLMResponseCachePrewarm:
+  """Tests for LLMResponseCache.prewarm."""
+
+  async def test_prewarm_uses_callback_cache_keys(self, provider):
+    """Test that prewarmed keys match the keys the callbacks build."""
+    llm_cache = LLMResponseCache(provider=provider)
+    session = MagicMock(app_name="app", user_id="user", id="session")
+    callback_context = MagicMock(session=session)
+
+    await llm_cache.prewarm(["hello"], app_name="app", user_id="user")
+
+    expected = llm_cache._build_cache_key("hello", callback_context)
+    assert expected == "app:app | user:user | hello"
+    assert provider._vector_key(expected) in provider._vectors
+
+  async def test_cache_key_follows_config(self, provider):
+    """Test that the key template includes only the enabled scopes."""
+    llm_cache = LLMResponseCache(
+        provider=provider,
+        config=LLMResponseCacheConfig(
+            include_user_id=False, include_session_id=True
+        ),
+    )
+    session = MagicMock(app_name="app", user_id="user", id="session")
+
+    key = llm_cache._build_cache_key("{hi}", MagicMock(session=session))
+
+    assert key == "app:app | session:session | {hi}"
+    assert key == llm_cache._format_cache_key(
+        "{hi}", app_name="app", user_id="user", session_id="session"
+    )
+
+
+class TestLLMResponseCacheCallbacks:
+  """Tests for the LLMResponseCache before/after model callbacks."""
+
+  async def test_pending_key_is_scoped_to_invocation(self):
+    """Test that a key is only stored by the invocation that set it."""
+    cache_provider = MagicMock()
+    cache_provider.check = AsyncMock(return_value=None)
+    cache_provider.store = AsyncMock()
+    llm_cache = LLMResponseCache(provider=cache_provider)
+    session = MagicMock(app_name="app", user_id="user", id="s", events=[])
+    request = MagicMock(
+        contents=[MagicMock(role="user", parts=[MagicMock(text="hi")])]
+    )
+    response = LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text="hello")])
+    )
+
+    await llm_cache.before_model_callback(
+        MagicMock(session=session, invocation_id="a"), request
+    )
+    await llm_cache.after_model_callback(
+        MagicMock(session=session, invocation_id="b"), response
+    )
+
+    cache_provider.store.assert_not_awaited()
+    await llm_cache.before_model_callback(
+        MagicMock(session=session, invocation_id="b"), request
+    )
+    await llm_cache.after_model_callback(
+        MagicMock(session=session, invocation_id="b"), response
+    )
+    cache_provider.store.assert_awaited_once_with(
+        "app:app | user:user | hi", "hello"
+    )
+
+  async def test_cache_errors_are_misses(self):
+    """Test that provider failures neither raise nor block the model call."""
+    cache_provider = MagicMock()
+    cache_provider.check = AsyncMock(side_effect=ConnectionError("down"))
+    llm_cache = LLMResponseCache(provider=cache_provider)
+    session = MagicMock(app_name="app", user_id="user", id="s", events=[])
+    request = MagicMock(
+        contents=[MagicMock(role="user", parts=[MagicMock(text="hi")])]
+    )
+
+    result = await llm_cache.before_model_callback(
+        MagicMock(session=session, invocation_id="a"), request
+    )
+
+    assert result is None
+
+
+@pytest.fixture
+def local_provider(mock_semantic_cache, mock_vectorizer):
+  """Create RedisVLCacheProvider with the local near-cache enabled."""
+  vectors = {"hello": [1.0, 0.0], "hi": [0.99, 0.05], "bye": [0.0, 1.0]}
+  mock_vectorizer.embed = MagicMock(
+      side_effect=lambda text, **kw: vectors[text]
+  )
+  return RedisVLCacheProvider(
+      config=RedisVLCacheProviderConfig(local_cache_size=2),
+      vectorizer=mock_vectorizer,
+  )
+
+
+class TestRedisVLCacheProviderLocalCache:
+  """Tests for the in-process near-cache."""
+
+  async def test_stored_entry_served_locally(
+      self, local_provider, mock_semantic_cache
+  ):
+    """Test that a similar prompt is answered without calling Redis."""
+    await local_provider.store("hello", "world")
+
+    entry = await local_provider.check("hi")
+
+    assert entry is not None
+    assert entry.response == "world"
+    mock_semantic_cache.acheck.assert_not_called()
+
+  async def test_repeat_prompt_skips_embedding_and_redis(
+      self, mock_semantic_cache, mock_vectorizer, mock_async_redis
+  ):
+    """Test that an exact local hit needs no embedding or Redis call."""
+    mock_vectorizer.embed = MagicMock(return_value=[1.0, 0.0])
+    provider = RedisVLCacheProvider(
+        config=RedisVLCacheProviderConfig(local_cache_size=2, exact_match=True),
+        vectorizer=mock_vectorizer,
+    )
+    await provider.store("hello", "world")
+    mock_vectorizer.embed.reset_mock()
+
+    entry = await provider.check("hello")
+
+    assert entry.response == "world"
+    mock_vectorizer.embed.assert_not_called()
+    mock_async_redis.get.assert_not_called()
+    mock_semantic_cache.acheck.assert_not_called()
+
+  async def test_local_miss_falls_through_to_redis(
+      self, local_provider, mock_semantic_cache
+  ):
+    """Test that a dissimilar prompt is checked in Redis with its vector."""
+    await local_provider.store("hello", "world")
+
+    assert await local_provider.check("bye") is None
+    assert mock_semantic_cache.acheck.call_args.kwargs["vector"] == [0.0, 1.0]
+
+  async def test_redis_hit_populates_local_cache(
+      self, local_provider, mock_semantic_cache
+  ):
+    """Test that a Redis hit is kept locally for the next lookup."""
+    mock_semantic_cache.acheck.return_value = [
+        {"response": "cached", "vector_distance": 0.0}
+    ]
+    await local_provider.check("bye")
+    await local_provider.check("bye")
+
+    mock_semantic_cache.acheck.assert_called_once()
+
+  async def test_redis_hit_expires_locally_first(
+      self, local_provider, mock_semantic_cache, monkeypatch
+  ):
+    """Test that a Redis hit is kept locally only briefly."""
+    mock_semantic_cache.acheck.return_value = [
+        {"response": "cached", "vector_distance": 0.0}
+    ]
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    await local_provider.check("bye")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    await local_provider.check("bye")
+
+    assert mock_semantic_cache.acheck.call_count == 2
+
+  async def test_clear_empties_local_cache(
+      self, local_provider, mock_semantic_cache
+  ):
+    """Test that clear also drops local entries."""
+    await local_provider.store("hello", "world")
+    await local_provider.clear()
+
+    assert await local_provider.check("hello") is None
+    mock_semantic_cache.acheck.assert_called_once()
@@ -0,0 +1,111 @@
+# Copyright 2025 Redis, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for ToolCache."""
+
+import datetime
+import json
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from adk_redis.cache import ToolCache
+from adk_redis.cache.tool_cache import _dumps
+from adk_redis.cache.tool_cache import _json_dumps
+
+
+class TestToolCacheKey:
+  """Tests for ToolCache cache key construction."""
+
+  def test_key_is_independent_of_arg_order(self):
+    """Test that argument order does not change the cache key."""
+    cache = ToolCache(provider=MagicMock())
+    context = MagicMock()
+
+    first = cache._build_cache_key("search", {"a": 1, "b": "x"}, context)
+    second = cache._build_cache_key("search", {"b": "x", "a": 1}, context)
+
+    assert first == second == 'tool:search | args:{"a": 1, "b": "x"}'
+
+  def test_key_serializes_unknown_types_as_str(self):
+    """Test that non-JSON argument values fall back to str()."""
+    cache = ToolCache(provider=MagicMock())
+
+    key = cache._build_cache_key("search", {"when": object}, MagicMock())
+
+    assert key == 'tool:search | args:{"when": "<class \'object\'>"}'
+
+  def test_key_handles_mixed_key_types(self):
+    """Test that nested dicts with non-str keys still give a stable key."""
+    cache = ToolCache(provider=MagicMock())
+
+    key = cache._build_cache_key("search", {"f": {1: "a", "b": 2}}, MagicMock())
+
+    assert key == 'tool:search | args:{"f": {"1": "a", "b": 2}}'
+
+
+class TestToolCacheCallbacks:
+  """Tests for the ToolCache before/after callbacks."""
+
+  async def test_miss_then_store(self):
+    """Test that a miss stores the serialized tool response."""
+    provider = MagicMock()
+    provider.check = AsyncMock(return_value=None)
+    provider.store = AsyncMock()
+    cache = ToolCache(provider=provider)
+    tool = MagicMock()
+    tool.name = "search"
+    context = MagicMock()
+
+    assert await cache.before_tool_callback(tool, {"q": "x"}, context) is None
+    await cache.after_tool_callback(tool, {"q": "x"}, context, {"ok": True})
+
+    provider.store.assert_awaited_once_with(
+        'tool:search | args:{"q": "x"}', '{"ok":true}'
+    )
+
+  async def test_unfinished_call_is_not_stored_later(self):
+    """Test that a call without an after callback leaves no pending key."""
+    provider = MagicMock()
+    provider.check = AsyncMock(side_effect=[None, MagicMock(response="{}")])
+    provider.store = AsyncMock()
+    cache = ToolCache(provider=provider)
+    tool = MagicMock()
+    tool.name = "search"
+
+    # The first call misses and then fails, so no after callback runs
+    await cache.before_tool_callback(tool, {"q": "x"}, MagicMock())
+    context = MagicMock()
+    assert await cache.before_tool_callback(tool, {"q": "y"}, context) == {}
+    await cache.after_tool_callback(tool, {"q": "y"}, context, {"ok": True})
+
+    provider.store.assert_not_awaited()
+
+
+class TestToolCacheSerialization:
+  """Tests for tool response serialization."""
+
+  def test_response_reads_back_the_same_with_or_without_orjson(self):
+    """Test that the orjson and stdlib paths agree on datetimes and ints."""
+    response = {
+        "when": datetime.datetime(2026, 10, 15, 9, 30),
+        "day": datetime.date(2026, 10, 15),
+        "big": 2**70,
+    }
+
+    assert json.loads(_dumps(response)) == json.loads(_json_dumps(response))
+    assert json.loads(_json_dumps(response)) == {
+        "when": "2026-10-15T09:30:00",
+        "day": "2026-10-15",
+        "big": 2**70,
+    }
@@ -0,0 +1,47 @@
+# Copyright 2025 Redis, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for memory service utilities."""
+
+from google.adk.events.event import Event
+from google.genai import types
+
+from adk_redis.memory._utils import extract_text_from_event
+
+
+def _event(*parts: types.Part) -> Event:
+  return Event(
+      author="user", content=types.Content(role="user", parts=list(parts))
+  )
+
+
+class TestExtractTextFromEvent:
+  """Tests for extract_text_from_event."""
+
+  def test_skips_thought_parts(self):
+    """Test that thought parts are left out of the text."""
+    event = _event(
+        types.Part(text="hello"),
+        types.Part(text="thinking", thought=True),
+        types.Part(text="world"),
+    )
+    assert extract_text_from_event(event) == "hello world"
+
+  def test_replaced_content_is_extracted_again(self):
+    """Test that the text follows content replaced on the event."""
+    event = _event(types.Part(text="before"))
+    assert extract_text_from_event(event) == "before"
+
+    event.content = types.Content(role="user", parts=[types.Part(text="after")])
+    assert extract_text_from_event(event) == "after"
@@ -14,6 +14,7 @@
 
 """Tests for RedisWorkingMemorySessionService."""
 
+import asyncio
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -104,6 +105,49 @@ class TestRedisWorkingMemorySessionServiceMethods:
   @pytest.mark.asyncio
   async def test_close_cleans_up_client(self, service):
     """Test close method completes without error."""
-    # The close method no longer caches or closes clients
-    # Just verify it can be called without error
     await service.close()
+
+  @pytest.mark.asyncio
+  async def test_client_reused_within_loop(self, service):
+    """Test that calls in one event loop share a client until close."""
+    client = service._get_client()
+
+    assert service._get_client() is client
+
+    await service.close()
+    assert service._get_client() is not client
+
+  def test_new_event_loop_gets_new_client(self, service):
+    """Test that a client is never reused across event loops."""
+
+    async def get_client():
+      return service._get_client()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+
+  def test_close_closes_clients_of_every_loop(self, service):
+    """Test that close releases clients made on other event loops."""
+
+    async def get_client():
+      client = service._get_client()
+      client.close = AsyncMock()
+      return client
+
+    idle_loop = asyncio.new_event_loop()
+    try:
+      idle = idle_loop.run_until_complete(get_client())
+      asyncio.run(get_client())
+
+      # The finished loop is dropped; the idle loop's client waits for a
+      # close() on its own loop
+      asyncio.run(service.close())
+      assert list(service._clients._loops) == [id(idle_loop)]
+
+      idle_loop.run_until_complete(service.close())
+      idle.close.assert_awaited_once()
+      assert not service._clients._loops
+    finally:
+      idle_loop.close()
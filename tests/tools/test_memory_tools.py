@@ -0,0 +1,79 @@
+# Copyright 2025 Redis, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for Redis Agent Memory tools."""
+
+import asyncio
+
+import pytest
+
+# Skip all tests if agent-memory-client is not installed
+pytest.importorskip("agent_memory_client")
+
+from adk_redis.tools.memory import CreateMemoryTool
+from adk_redis.tools.memory import MemoryToolConfig
+from adk_redis.tools.memory import SearchMemoryTool
+
+
+class TestMemoryToolClient:
+  """Tests for MemoryAPIClient sharing across memory tools."""
+
+  async def test_tools_share_client_within_loop(self):
+    """Test that tools with the same settings reuse one client."""
+    config = MemoryToolConfig(default_namespace="shared")
+    create_tool = CreateMemoryTool(config=config)
+    search_tool = SearchMemoryTool(config=config)
+
+    client = create_tool._get_client()
+
+    assert create_tool._get_client() is client
+    assert search_tool._get_client() is client
+
+  async def test_different_settings_get_different_clients(self):
+    """Test that tools pointing at different servers do not share."""
+    tool_a = CreateMemoryTool(
+        config=MemoryToolConfig(api_base_url="http://a:8000")
+    )
+    tool_b = CreateMemoryTool(
+        config=MemoryToolConfig(api_base_url="http://b:8000")
+    )
+
+    assert tool_a._get_client() is not tool_b._get_client()
+
+  def test_new_event_loop_gets_new_client(self):
+    """Test that a client is never reused across event loops."""
+    tool = CreateMemoryTool()
+
+    async def get_client():
+      return tool._get_client()
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+
+  def test_closed_loops_are_released(self):
+    """Test that clients of finished event loops are not retained."""
+    from adk_redis.tools.memory._base import _shared_clients
+
+    tool = CreateMemoryTool()
+
+    async def get_client():
+      return tool._get_client()
+
+    for _ in range(5):
+      asyncio.run(get_client())
+
+    # Only the loop seen last can still be registered
+    assert len(_shared_clients._loops) <= 1
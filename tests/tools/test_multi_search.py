@@ -0,0 +1,123 @@
+# Copyright 2025 Redis, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for RedisMultiSearchTool."""
+
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+import pytest
+
+# Skip all tests if redisvl is not installed
+pytest.importorskip("redisvl")
+
+from redisvl.index import SearchIndex
+from redisvl.query import TextQuery
+from redisvl.query import VectorQuery
+from redisvl.query import VectorRangeQuery
+from redisvl.utils.vectorize import BaseVectorizer
+
+from adk_redis.tools import RedisMultiSearchTool
+from adk_redis.tools import RedisRangeQueryConfig
+from adk_redis.tools import RedisVectorQueryConfig
+
+
+@pytest.fixture
+def mock_vectorizer():
+  """Mock RedisVL vectorizer."""
+  vectorizer = MagicMock(spec=BaseVectorizer)
+  vectorizer.embed = MagicMock(return_value=[0.1] * 384)
+  vectorizer.aembed = AsyncMock(return_value=[0.1] * 384)
+  return vectorizer
+
+
+@pytest.fixture
+def mock_index():
+  """Mock RedisVL SearchIndex."""
+  index = MagicMock(spec=SearchIndex)
+  index.batch_query = MagicMock(
+      return_value=[
+          [{"title": "Vector Doc", "vector_distance": 0.1}],
+          [{"title": "Text Doc", "score": 1.5}],
+          [],
+      ]
+  )
+  return index
+
+
+@pytest.fixture
+def multi_search_tool(mock_index, mock_vectorizer):
+  """Create RedisMultiSearchTool instance for testing."""
+  return RedisMultiSearchTool(
+      index=mock_index,
+      vectorizer=mock_vectorizer,
+      vector_config=RedisVectorQueryConfig(num_results=5),
+      range_config=RedisRangeQueryConfig(distance_threshold=0.5),
+      return_fields=["title"],
+  )
+
+
+class TestRedisMultiSearchToolBuildQueries:
+  """Tests for RedisMultiSearchTool query building."""
+
+  def test_build_queries(self, multi_search_tool):
+    """Test that one query of each type is built from the config."""
+    vector_query, text_query, range_query = multi_search_tool._build_queries(
+        "redis", [0.1] * 384
+    )
+
+    assert isinstance(vector_query, VectorQuery)
+    assert isinstance(text_query, TextQuery)
+    assert isinstance(range_query, VectorRangeQuery)
+    assert vector_query._num_results == 5
+    assert range_query.distance_threshold == 0.5
+
+
+class TestRedisMultiSearchToolRun:
+  """Tests for RedisMultiSearchTool execution."""
+
+  async def test_run_pipelines_all_queries(
+      self, multi_search_tool, mock_index, mock_vectorizer
+  ):
+    """Test that all three queries go to Redis in one batch."""
+    result = await multi_search_tool.run_async(
+        args={"query": "redis"}, tool_context=MagicMock()
+    )
+
+    mock_vectorizer.aembed.assert_awaited_once_with("redis")
+    mock_index.batch_query.assert_called_once()
+    assert len(mock_index.batch_query.call_args.args[0]) == 3
+    assert result["status"] == "success"
+    assert result["semantic"]["count"] == 1
+    assert result["keyword"]["results"][0]["title"] == "Text Doc"
+    assert result["range"] == {"count": 0, "results": []}
+
+  async def test_run_requires_query(self, multi_search_tool, mock_index):
+    """Test that an empty query returns an error without searching."""
+    result = await multi_search_tool.run_async(
+        args={"query": ""}, tool_context=MagicMock()
+    )
+
+    assert result["status"] == "error"
+    mock_index.batch_query.assert_not_called()
+
+  async def test_run_reports_errors(self, multi_search_tool, mock_index):
+    """Test that search failures are returned as an error status."""
+    mock_index.batch_query.side_effect = RuntimeError("boom")
+
+    result = await multi_search_tool.run_async(
+        args={"query": "redis"}, tool_context=MagicMock()
+    )
+
+    assert result == {"status": "error", "error": "boom"}
@@ -160,3 +160,47 @@ class TestRedisVectorSearchToolBuildQuery:
     )
 
     assert query._num_results == 15
+
+
+class TestRedisVectorSearchToolEmbeddingCache:
+  """Tests for query embedding caching."""
+
+  async def test_repeated_query_embeds_once(
+      self, vector_search_tool, mock_vectorizer
+  ):
+    """Test that an identical query reuses the cached embedding."""
+    for _ in range(3):
+      result = await vector_search_tool.run_async(
+          args={"query": "redis"}, tool_context=MagicMock()
+      )
+      assert result["status"] == "success"
+
+    mock_vectorizer.aembed.assert_awaited_once_with("redis")
+
+  async def test_cache_evicts_least_recently_used(
+      self, mock_index, mock_vectorizer
+  ):
+    """Test that the cache is bounded and evicts the oldest query."""
+    tool = RedisVectorSearchTool(
+        index=mock_index,
+        vectorizer=mock_vectorizer,
+        embedding_cache_size=2,
+    )
+    for query in ("a", "b", "a", "c", "a", "b"):
+      await tool.run_async(args={"query": query}, tool_context=MagicMock())
+
+    # "b" was evicted by "c"; "a" stayed hot throughout.
+    embedded = [c.args[0] for c in mock_vectorizer.aembed.await_args_list]
+    assert embedded == ["a", "b", "c", "b"]
+
+  async def test_cache_disabled(self, mock_index, mock_vectorizer):
+    """Test that a cache size of 0 embeds every call."""
+    tool = RedisVectorSearchTool(
+        index=mock_index,
+        vectorizer=mock_vectorizer,
+        embedding_cache_size=0,
+    )
+    for _ in range(2):
+      await tool.run_async(args={"query": "redis"}, tool_context=MagicMock())
+
+    assert mock_vectorizer.aembed.await_count == 2